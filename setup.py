@@ -11,7 +11,8 @@ def install_requirements():
     requirements = [
         "PyQt5",
         "requests",
-        "beautifulsoup4"
+        "beautifulsoup4",
+        "packaging"
     ]
     installed_packages = []
     already_installed_packages = []
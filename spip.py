@@ -1,21 +1,85 @@
 import os
 import sys
+import json
+import asyncio
+import hashlib
+import tempfile
+import queue
+import bisect
 import subprocess
 import threading
 import time
+import shutil
+import errno
+import zipfile
+import configparser
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import url2pathname
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QLabel, QLineEdit,
     QPushButton, QTableWidget, QTableWidgetItem, QComboBox,
     QWidget, QHBoxLayout, QMessageBox, QProgressBar, QHeaderView,
-    QFileDialog, QTextEdit, QListWidget, QInputDialog, QTabWidget
+    QFileDialog, QTextEdit, QListWidget, QInputDialog, QTabWidget,
+    QCheckBox, QListWidgetItem, QPlainTextEdit
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QUrl
-from PyQt5.QtGui import QDesktopServices
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QUrl, QFileSystemWatcher
+from PyQt5.QtGui import QDesktopServices, QColor
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup  # For parsing HTML in fetch_all_packages
+from packaging.version import Version, InvalidVersion
+from packaging.requirements import Requirement, InvalidRequirement
+from packaging.specifiers import SpecifierSet
 import importlib
 import re
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+# Per-user cache for resolution reports and other derived data
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".superpip")
+PLAN_CACHE_DIR = os.path.join(CACHE_DIR, "plans")
+METADATA_CACHE_DIR = os.path.join(CACHE_DIR, "pypi-metadata")
+METADATA_CACHE_TTL = 24 * 60 * 60  # Seconds before PyPI metadata is fetched again
+CONFIG_PATH = os.path.join(CACHE_DIR, "config.json")
+IMPORT_PROFILE_CACHE_DIR = os.path.join(CACHE_DIR, "import-profiles")
+
+# Content-addressed store of unpacked wheels shared by linked environments
+STORE_DIR = os.path.join(CACHE_DIR, "store")
+STORE_OBJECTS_DIR = os.path.join(STORE_DIR, "objects")
+STORE_REFS_PATH = os.path.join(STORE_DIR, "refs.json")
+STORE_LOCK_PATH = os.path.join(STORE_DIR, "store.lock")
+STORE_OBJECT_META = "superpip-object.json"
+STORE_PENDING_TTL = 6 * 60 * 60  # Seconds an unfinished build keeps its objects (and .tmp-* folders) alive
+
+# Where catalogs, searches and installs get their packages from
+INDEX_SOURCE_KINDS = {
+    "pypi": "PyPI (pypi.org)",
+    "mirror": "Internal mirror URL",
+    "simple-dir": "Local simple-index directory",
+    "wheelhouse": "Local wheelhouse (file:// or directory)",
+}
+DEFAULT_INDEX_SOURCE = {"kind": "pypi", "location": ""}
+
+# Distributions that environment sync never pins or removes on a target
+PROTECTED_DISTRIBUTIONS = {"pip", "setuptools", "wheel"}
 
 # === CONSOLE LOADING SCREEN ===
 def show_console_loading_screen():
@@ -224,23 +288,1509 @@ def fetch_curated_packages():
     }
     return curated_packages
 
-def fetch_all_packages():
-    """Fetch all available packages from PyPI Simple with module-package mapping."""
+# === Index Source ===
+_index_source = None
+
+def load_config():
+    try:
+        with open(CONFIG_PATH, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+def save_config(config):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(CONFIG_PATH + ".tmp", "w", encoding="utf-8") as fh:
+        json.dump(config, fh, indent=2)
+    os.replace(CONFIG_PATH + ".tmp", CONFIG_PATH)
+
+def get_index_source():
+    """Return the configured index source, loading it from the config file on first use."""
+    global _index_source
+    if _index_source is None:
+        source = load_config().get("index_source", DEFAULT_INDEX_SOURCE)
+        if source.get("kind") not in INDEX_SOURCE_KINDS:
+            source = DEFAULT_INDEX_SOURCE
+        _index_source = dict(source)
+    return _index_source
+
+def set_index_source(kind, location=""):
+    """Switch the index source for this session and persist it."""
+    global _index_source
+    _index_source = {"kind": kind, "location": location}
+    config = load_config()
+    config["index_source"] = _index_source
+    save_config(config)
+
+def local_index_path(location):
+    """Accept either a file:// URL or a plain path for local index sources."""
+    if location.startswith("file://"):
+        return url2pathname(urlparse(location).path)
+    return os.path.abspath(os.path.expanduser(location))
+
+def pip_index_args(source=None):
+    """pip options that point an install at the configured index source."""
+    source = source or get_index_source()
+    kind, location = source["kind"], source["location"]
+    if kind == "mirror":
+        args = ["--index-url", location]
+        if location.startswith("http://"):
+            args += ["--trusted-host", urlparse(location).hostname]
+        return args
+    if kind == "simple-dir":
+        return ["--index-url", Path(local_index_path(location)).as_uri()]
+    if kind == "wheelhouse":
+        return ["--no-index", "--find-links", local_index_path(location)]
+    return []
+
+def describe_index_source(source=None):
+    source = source or get_index_source()
+    if source["kind"] == "pypi":
+        return INDEX_SOURCE_KINDS["pypi"]
+    return f"{INDEX_SOURCE_KINDS[source['kind']]}: {source['location']}"
+
+def catalog_from_names(names):
+    """Build the module -> package mapping used by the catalog from project names."""
+    packages = {}
+    for pkg in names:
+        module_name = pkg.split('.')[0].lower()
+        packages[module_name] = pkg
+    return packages
+
+def parse_simple_index(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    return [a.text for a in soup.find_all('a')]
+
+def project_name_from_filename(filename):
+    """Extract the project name from a wheel or sdist file name."""
+    if filename.endswith(".whl"):
+        return filename.split("-")[0]
+    for extension in (".tar.gz", ".zip", ".tar.bz2"):
+        if filename.endswith(extension):
+            return filename[:-len(extension)].rsplit("-", 1)[0]
+    return None
+
+def scan_local_catalog(source):
+    """List the projects available in a local simple-index directory or wheelhouse."""
+    path = local_index_path(source["location"])
+    names = set()
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if source["kind"] == "simple-dir":
+                if entry.is_dir():
+                    names.add(entry.name)
+            elif entry.is_file():
+                name = project_name_from_filename(entry.name)
+                if name:
+                    names.add(name)
+    return sorted(names, key=str.lower)
+
+def fetch_all_packages(source=None):
+    """Fetch all available packages from the configured index with module-package mapping."""
+    source = source or get_index_source()
     try:
-        response = requests.get("https://pypi.org/simple/")
+        if source["kind"] in ("simple-dir", "wheelhouse"):
+            return catalog_from_names(scan_local_catalog(source))
+        url = source["location"] if source["kind"] == "mirror" else "https://pypi.org/simple/"
+        response = requests.get(url, timeout=30)
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            packages = {}
-            for a in soup.find_all('a'):
-                pkg = a.text
-                module_name = pkg.split('.')[0].lower()
-                packages[module_name] = pkg
-            return packages
+            return catalog_from_names(parse_simple_index(response.text))
+        print(f"\nCould not load the package catalog from {url}: HTTP {response.status_code}")
+        return {}
+    except Exception as e:
+        print(f"\nCould not load the package catalog from {describe_index_source(source)}: {e}")
+        return {}
+
+# === PyPI Metadata ===
+def fetch_pypi_metadata(session, package_name):
+    """Fetch the summary, latest version and release date of a package from the PyPI JSON API."""
+    response = session.get(f"https://pypi.org/pypi/{package_name}/json", timeout=10)
+    if response.status_code == 404:
+        return {"summary": "Not found on PyPI", "version": "", "released": ""}
+    response.raise_for_status()
+    data = response.json()
+    info = data["info"]
+    files = data.get("urls") or data.get("releases", {}).get(info["version"], [])
+    upload_times = [f["upload_time"] for f in files if f.get("upload_time")]
+    return {
+        "summary": info.get("summary") or "",
+        "version": info.get("version") or "",
+        "released": min(upload_times)[:10] if upload_times else "",
+    }
+
+class PackageMetadataCache:
+    """Bounded in-memory LRU in front of a per-package on-disk JSON cache with a TTL."""
+
+    def __init__(self, max_entries=2048, ttl=METADATA_CACHE_TTL, cache_dir=METADATA_CACHE_DIR):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _path(self, package_name):
+        return os.path.join(self.cache_dir, f"{normalize_name(package_name)}.json")
+
+    def _remember(self, key, metadata):
+        self.entries[key] = metadata
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def get(self, package_name):
+        key = normalize_name(package_name)
+        with self.lock:
+            metadata = self.entries.get(key)
+            if metadata is not None:
+                if time.time() - metadata["fetched_at"] < self.ttl:
+                    self.entries.move_to_end(key)
+                    return metadata
+                del self.entries[key]
+        try:
+            with open(self._path(package_name), encoding="utf-8") as fh:
+                metadata = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if time.time() - metadata.get("fetched_at", 0) >= self.ttl:
+            return None
+        with self.lock:
+            self._remember(key, metadata)
+        return metadata
+
+    def put(self, package_name, metadata):
+        metadata = dict(metadata, fetched_at=time.time())
+        with self.lock:
+            self._remember(normalize_name(package_name), metadata)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(package_name)
+            with open(path + ".tmp", "w", encoding="utf-8") as fh:
+                json.dump(metadata, fh)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            pass  # The in-memory entry is still usable
+        return metadata
+
+class PackageMetadataFetcher(QThread):
+    """Runs an asyncio loop that prefetches PyPI metadata for the visible table rows.
+
+    Requests share one pooled requests.Session and are limited by a semaphore;
+    fetches for rows that scrolled out of view are cancelled before they start,
+    while ones already under way still finish and fill the cache.
+    """
+    metadata_ready_signal = pyqtSignal(str, dict)
+
+    def __init__(self, cache, max_concurrency=8):
+        super().__init__()
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.loop = None
+        self.tasks = {}
+        self.visible = set()
+        self.in_flight = set()
+        self.ready = threading.Event()
+        self.stopping = False
+
+    def run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency))
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        self.loop.set_default_executor(executor)
+        self.ready.set()
+        try:
+            if not self.stopping:  # stop() may have been called before the loop existed
+                self.loop.run_forever()
+            for task in self.tasks.values():
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*self.tasks.values(), return_exceptions=True))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.session.close()
+            self.loop.close()
+
+    def request_visible(self, package_names):
+        """Fetch metadata for these packages and cancel pending fetches for any others."""
+        if self.ready.is_set() and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._update_visible, list(package_names))
+
+    def _update_visible(self, package_names):
+        self.visible = set(package_names)
+        for package_name, task in list(self.tasks.items()):
+            if package_name not in self.visible and package_name not in self.in_flight:
+                task.cancel()
+                del self.tasks[package_name]
+        for package_name in package_names:
+            if package_name not in self.tasks:
+                self.tasks[package_name] = self.loop.create_task(self._fetch(package_name))
+
+    async def _fetch(self, package_name):
+        try:
+            async with self.semaphore:
+                self.in_flight.add(package_name)
+                metadata = await self.loop.run_in_executor(
+                    None, fetch_pypi_metadata, self.session, package_name
+                )
+            metadata = self.cache.put(package_name, metadata)
+            if package_name in self.visible:
+                self.metadata_ready_signal.emit(package_name, metadata)
+        except (requests.RequestException, ValueError, KeyError):
+            pass
+        finally:
+            self.in_flight.discard(package_name)
+            if self.tasks.get(package_name) is asyncio.current_task():
+                del self.tasks[package_name]
+
+    def stop(self):
+        self.stopping = True
+        if self.isRunning():
+            self.ready.wait()
+            try:
+                self.loop.call_soon_threadsafe(self.loop.stop)
+            except RuntimeError:
+                pass  # run() saw the flag and already closed the loop
+        self.wait()
+
+# === Environment Inspection ===
+_interpreter_info_cache = {}
+
+# Runs inside the target interpreter; mirrors packaging.markers.default_environment()
+_INTERPRETER_INFO_SCRIPT = """
+import json, os, platform, sys, sysconfig
+iv = sys.implementation.version
+implementation_version = f"{iv.major}.{iv.minor}.{iv.micro}"
+if iv.releaselevel != "final":
+    implementation_version += iv.releaselevel[0] + str(iv.serial)
+try:
+    from pip import __version__ as pip_version
+except ImportError:
+    pip_version = None
+print(json.dumps({
+    "version": sys.version,
+    "platform": sysconfig.get_platform(),
+    "paths": [p for p in sys.path if p],
+    "pip_version": pip_version,
+    "markers": {
+        "implementation_name": sys.implementation.name,
+        "implementation_version": implementation_version,
+        "os_name": os.name,
+        "platform_machine": platform.machine(),
+        "platform_release": platform.release(),
+        "platform_system": platform.system(),
+        "platform_version": platform.version(),
+        "python_full_version": platform.python_version(),
+        "platform_python_implementation": platform.python_implementation(),
+        "python_version": ".".join(platform.python_version_tuple()[:2]),
+        "sys_platform": sys.platform,
+    },
+}))
+"""
+
+def normalize_name(name):
+    """Normalize a distribution name the way pip compares them."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def get_interpreter_info(python_exec):
+    """Return the version, import paths and marker environment of an interpreter (cached per executable)."""
+    if python_exec not in _interpreter_info_cache:
+        output = subprocess.check_output([python_exec, "-c", _INTERPRETER_INFO_SCRIPT], text=True)
+        _interpreter_info_cache[python_exec] = json.loads(output)
+    return _interpreter_info_cache[python_exec]
+
+def get_site_dirs(target):
+    """Return the directories whose distributions are visible to an install target."""
+    if target.startswith("custom:"):
+        return [target.split("custom:", 1)[1]]
+    return [path for path in get_interpreter_info(target)["paths"] if os.path.isdir(path)]
+
+def read_distribution_metadata(path):
+    """Read the Name and Version headers of a .dist-info or .egg-info entry."""
+    if os.path.isdir(path):
+        metadata_file = os.path.join(path, "METADATA" if path.endswith(".dist-info") else "PKG-INFO")
+    else:
+        metadata_file = path
+    headers = {}
+    try:
+        with open(metadata_file, encoding="utf-8", errors="replace") as fh:
+            for line in fh:
+                if not line.strip():
+                    break
+                key, _, value = line.partition(":")
+                if key in ("Name", "Version") and key not in headers:
+                    headers[key] = value.strip()
+    except OSError:
+        return None
+    if "Name" not in headers:
+        return None
+    return headers
+
+def installed_distributions(target):
+    """Scan the metadata of every distribution visible to a target.
+
+    Returns a dict keyed by normalized name with the display name, version and
+    metadata path. Earlier path entries shadow later ones, as at import time.
+    """
+    distributions = {}
+    for site_dir in get_site_dirs(target):
+        try:
+            entries = sorted(os.scandir(site_dir), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if not entry.name.endswith((".dist-info", ".egg-info")):
+                continue
+            headers = read_distribution_metadata(entry.path)
+            if not headers:
+                continue
+            key = normalize_name(headers["Name"])
+            if key not in distributions:
+                distributions[key] = {
+                    "name": headers["Name"],
+                    "version": headers.get("Version", ""),
+                    "path": entry.path,
+                }
+    return distributions
+
+def diff_distributions(old, new):
+    """Compare two installed_distributions() results.
+
+    Returns the keys that were added, removed, and whose version changed.
+    """
+    added = sorted(key for key in new if key not in old)
+    removed = sorted(key for key in old if key not in new)
+    changed = sorted(key for key in new if key in old and new[key]["version"] != old[key]["version"])
+    return added, removed, changed
+
+def environment_fingerprint(target):
+    """Hash the interpreter and the set of installed distributions of a target."""
+    if target.startswith("custom:"):
+        interpreter = get_interpreter_info(sys.executable)
+    else:
+        interpreter = get_interpreter_info(target)
+    entries = []
+    for site_dir in get_site_dirs(target):
+        try:
+            entries.extend(
+                name for name in os.listdir(site_dir)
+                if name.endswith((".dist-info", ".egg-info"))
+            )
+        except OSError:
+            continue
+    payload = json.dumps({
+        "target": target,
+        "version": interpreter["version"],
+        "platform": interpreter["platform"],
+        "distributions": sorted(entries),
+        "index": pip_index_args(),
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+# === Install Planning ===
+def build_pip_install_command(target, args):
+    """Build the pip install command line for an interpreter or custom:<dir> target.
+
+    The configured index source is always applied, so every install goes to
+    the same index the catalog was loaded from.
+    """
+    index_args = pip_index_args()
+    if target.startswith("custom:"):
+        custom_path = target.split("custom:", 1)[1]
+        return [sys.executable, "-m", "pip", "install", *index_args, *args, "--target", custom_path]
+    return [target, "-m", "pip", "install", *index_args, *args]
+
+def format_size(num_bytes):
+    """Format a byte count for display."""
+    if num_bytes is None:
+        return "unknown"
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+def fetch_download_size(url):
+    """Return the size in bytes of a distribution archive, or None if unknown."""
+    if url.startswith("file://"):
+        path = url2pathname(urlparse(url).path)
+        return os.path.getsize(path) if os.path.isfile(path) else None
+    try:
+        response = requests.head(url, allow_redirects=True, timeout=10)
+        length = response.headers.get("Content-Length")
+        return int(length) if response.ok and length else None
+    except (requests.RequestException, ValueError):
+        return None
+
+def plan_cache_key(requirements, fingerprint):
+    """Key a resolution report by requirement set and environment fingerprint."""
+    payload = json.dumps({"requirements": sorted(requirements), "fingerprint": fingerprint})
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def load_cached_plan(target, requirements):
+    """Return the cached plan for this requirement set if the target is unchanged."""
+    key = plan_cache_key(requirements, environment_fingerprint(target))
+    try:
+        with open(os.path.join(PLAN_CACHE_DIR, f"{key}.json"), encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+def save_cached_plan(plan):
+    os.makedirs(PLAN_CACHE_DIR, exist_ok=True)
+    path = os.path.join(PLAN_CACHE_DIR, f"{plan['key']}.json")
+    with open(path + ".tmp", "w", encoding="utf-8") as fh:
+        json.dump(plan, fh)
+    os.replace(path + ".tmp", path)
+
+def classify_change(current, new):
+    """Describe whether installing version `new` over `current` is an upgrade or downgrade."""
+    if not current:
+        return "install"
+    try:
+        current_version, new_version = Version(current), Version(new)
+    except InvalidVersion:
+        return "reinstall" if current == new else "replace"
+    if new_version > current_version:
+        return "upgrade"
+    if new_version < current_version:
+        return "downgrade"
+    return "reinstall"
+
+def run_pip_report(target, requirements, extra_args=()):
+    """Resolve requirements for a target with `pip install --dry-run --report`."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        report_path = os.path.join(tmp_dir, "report.json")
+        cmd = build_pip_install_command(
+            target, [*requirements, *extra_args, "--dry-run", "--quiet", "--report", report_path]
+        )
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"pip exited with code {result.returncode}")
+        with open(report_path, encoding="utf-8") as fh:
+            return json.load(fh)
+
+def plan_install(target, requirements):
+    """Resolve what installing `requirements` into `target` would change.
+
+    Runs `pip install --dry-run --report` and caches the result keyed by the
+    requirement set plus the environment fingerprint, so an unchanged plan is
+    returned without resolving again.
+    """
+    cached = load_cached_plan(target, requirements)
+    if cached:
+        return cached
+    fingerprint = environment_fingerprint(target)
+    report = run_pip_report(target, requirements)
+
+    installed = installed_distributions(target)
+    items = []
+    for entry in report.get("install", []):
+        metadata = entry.get("metadata", {})
+        name = metadata.get("name", "")
+        current = installed.get(normalize_name(name), {}).get("version")
+        items.append({
+            "name": name,
+            "version": metadata.get("version", ""),
+            "current": current,
+            "action": classify_change(current, metadata.get("version", "")),
+            "url": entry.get("download_info", {}).get("url", ""),
+            "is_direct": entry.get("is_direct", False),
+            "requested": entry.get("requested", False),
+        })
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sizes = list(executor.map(lambda item: fetch_download_size(item["url"]) if item["url"] else None, items))
+    for item, size in zip(items, sizes):
+        item["size"] = size
+
+    plan = {
+        "key": plan_cache_key(requirements, fingerprint),
+        "target": target,
+        "requirements": sorted(requirements),
+        "fingerprint": fingerprint,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "items": items,
+        "total_size": sum(item["size"] or 0 for item in items),
+    }
+    save_cached_plan(plan)
+    return plan
+
+def pinned_install_args(plan):
+    """Turn a resolved plan into pip arguments that skip resolution entirely."""
+    args = []
+    for item in plan["items"]:
+        if item["is_direct"] and item["url"]:
+            args.append(item["url"])
         else:
-            return {}
-    except Exception:
+            args.append(f"{item['name']}=={item['version']}")
+    return args + ["--no-deps"]
+
+# === Install Plan Thread ===
+class InstallPlanThread(QThread):
+    plans_ready_signal = pyqtSignal(list)
+    progress_signal = pyqtSignal(int)
+
+    def __init__(self, targets, requirements):
+        super().__init__()
+        self.targets = targets
+        self.requirements = requirements
+
+    def run(self):
+        plans = []
+        with ThreadPoolExecutor(max_workers=min(8, len(self.targets))) as executor:
+            futures = {
+                executor.submit(plan_install, target, self.requirements): target
+                for target in self.targets
+            }
+            for processed, future in enumerate(as_completed(futures), start=1):
+                target = futures[future]
+                try:
+                    plans.append(future.result())
+                except Exception as e:
+                    plans.append({"target": target, "error": str(e), "items": [], "total_size": 0})
+                self.progress_signal.emit(int((processed / len(futures)) * 100))
+        order = {target: index for index, target in enumerate(self.targets)}
+        plans.sort(key=lambda plan: order[plan["target"]])
+        self.plans_ready_signal.emit(plans)
+
+# === Pip Progress Streaming ===
+PIP_SIZE_UNITS = {"bytes": 1, "kB": 1000, "MB": 1000 ** 2, "GB": 1000 ** 3}
+PIP_SIZE_PATTERN = re.compile(r"\((\d+(?:\.\d+)?)\s*(bytes|kB|MB|GB)\)")
+PIP_NAME_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+INSTALL_LOG_MAX_LINES = 5000  # Older log lines are discarded to keep GUI memory bounded
+
+def package_from_location(location):
+    """Project name from a wheel/sdist file name, path or URL."""
+    filename = location.rstrip("/").rsplit("/", 1)[-1].split("#")[0]
+    return project_name_from_filename(filename) or filename
+
+def parse_pip_line(line):
+    """Turn one line of pip install output into a structured event, or None."""
+    line = line.strip()
+    size_match = PIP_SIZE_PATTERN.search(line)
+    total = None
+    if size_match:
+        total = int(float(size_match.group(1)) * PIP_SIZE_UNITS[size_match.group(2)])
+    if line.startswith("Collecting "):
+        name = PIP_NAME_PATTERN.match(line[len("Collecting "):])
+        return {"kind": "collecting", "package": name.group(0) if name else line[11:]}
+    if line.startswith(("Downloading ", "Using cached ", "Processing ")):
+        kind = {"D": "downloading", "U": "cached", "P": "processing"}[line[0]]
+        location = line.split(" ", 2 if kind == "cached" else 1)[-1]
+        location = PIP_SIZE_PATTERN.sub("", location).strip()
+        return {"kind": kind, "package": package_from_location(location), "total": total}
+    progress = re.match(r"Progress (\d+) of (\d+)", line)
+    if progress:
+        return {"kind": "progress", "downloaded": int(progress.group(1)), "total": int(progress.group(2))}
+    building = re.match(r"Building wheel for (\S+)", line)
+    if building:
+        return {"kind": "building", "package": building.group(1)}
+    if line.startswith("Requirement already satisfied: "):
+        name = PIP_NAME_PATTERN.match(line[len("Requirement already satisfied: "):])
+        return {"kind": "satisfied", "package": name.group(0) if name else ""}
+    if line.startswith("Installing collected packages: "):
+        packages = [pkg.strip() for pkg in line.split(":", 1)[1].split(",") if pkg.strip()]
+        return {"kind": "installing", "packages": packages}
+    if line.startswith("Successfully installed "):
+        packages = [pkg.rsplit("-", 1)[0] for pkg in line.split()[2:]]
+        return {"kind": "installed", "packages": packages}
+    if line.startswith("Successfully uninstalled "):
+        return {"kind": "uninstalled", "packages": [line.split()[-1].rsplit("-", 1)[0]]}
+    if line.startswith("ERROR:"):
+        return {"kind": "error", "message": line[len("ERROR:"):].strip()}
+    return None
+
+class PipProgressTracker:
+    """Follows the download in flight for one target and adds byte counts and throughput."""
+
+    def __init__(self):
+        self.download = None
+
+    def feed(self, line):
+        events = []
+        event = parse_pip_line(line)
+        if event is None:
+            return events
+        now = time.monotonic()
+        if event["kind"] == "progress" and self.download:
+            elapsed = max(now - self.download["started"], 1e-6)
+            self.download["total"] = event["total"]
+            events.append(dict(event, package=self.download["package"], rate=event["downloaded"] / elapsed))
+            return events
+        if self.download:
+            # pip prints no completion line; the next event ends the current download
+            total = self.download["total"]
+            elapsed = max(now - self.download["started"], 1e-6)
+            events.append({
+                "kind": "downloaded", "package": self.download["package"],
+                "downloaded": total, "total": total, "rate": (total or 0) / elapsed,
+            })
+            self.download = None
+        if event["kind"] == "downloading":
+            self.download = {"package": event["package"], "total": event["total"], "started": now}
+        events.append(event)
+        return events
+
+class PipInstallThread(QThread):
+    """Runs pip jobs with their output streamed line by line into structured events.
+
+    Jobs for different targets run concurrently; jobs for the same target run
+    in order. Each process gets a reader thread feeding a queue, so no read
+    ever blocks the loop that emits signals to the GUI.
+    """
+    event_signal = pyqtSignal(str, dict)
+    log_signal = pyqtSignal(str, str)
+    target_finished_signal = pyqtSignal(str, bool)
+    finished_signal = pyqtSignal(list)
+
+    def __init__(self, jobs, max_parallel_targets=4):
+        super().__init__()
+        self.jobs = jobs
+        self.max_parallel_targets = max_parallel_targets
+        self.lines = queue.Queue()
+
+    def streaming_command(self, target, cmd):
+        if len(cmd) < 4 or cmd[3] != "install":
+            return cmd
+        python_exec = sys.executable if target.startswith("custom:") else target
+        try:
+            pip_version = get_interpreter_info(python_exec).get("pip_version")
+            if pip_version and Version(pip_version) >= Version("24.1"):
+                return cmd[:4] + ["--progress-bar", "raw"] + cmd[4:]
+        except (OSError, subprocess.CalledProcessError, ValueError, InvalidVersion):
+            pass
+        return cmd
+
+    def run_target(self, target, commands):
+        errors = []
+        env = dict(os.environ, PYTHONUNBUFFERED="1")
+        try:
+            for cmd in commands:
+                try:
+                    process = subprocess.Popen(
+                        self.streaming_command(target, cmd), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                        text=True, bufsize=1, errors="replace", env=env
+                    )
+                except OSError as e:
+                    errors.append(f"Failed to run pip for {target}: {e}")
+                    continue
+                for line in process.stdout:
+                    self.lines.put((target, line.rstrip("\n"), None))
+                returncode = process.wait()
+                if returncode != 0:
+                    errors.append(f"Failed to install to {target}: pip exited with code {returncode}")
+        finally:
+            self.lines.put((target, None, errors))
+
+    def run(self):
+        commands_by_target = {}
+        for target, cmd in self.jobs:
+            commands_by_target.setdefault(target, []).append(cmd)
+        trackers = {target: PipProgressTracker() for target in commands_by_target}
+        errors = []
+        running = len(commands_by_target)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_parallel_targets, running))) as executor:
+            for target, commands in commands_by_target.items():
+                executor.submit(self.run_target, target, commands)
+            while running:
+                target, line, target_errors = self.lines.get()
+                if line is None:
+                    running -= 1
+                    errors.extend(target_errors)
+                    self.target_finished_signal.emit(target, not target_errors)
+                    continue
+                self.log_signal.emit(target, line)
+                for event in trackers[target].feed(line):
+                    self.event_signal.emit(target, event)
+        self.finished_signal.emit(errors)
+
+# === Environment Matrix ===
+def sync_install_args(reference, installed, names=None):
+    """Pins for every reference distribution the target lacks or has at another version.
+
+    Packaging tools are left alone: each target keeps the pip, setuptools and
+    wheel that suit its own interpreter.
+    """
+    args = []
+    for key, dist in sorted(reference.items()):
+        if key in PROTECTED_DISTRIBUTIONS or (names is not None and key not in names):
+            continue
+        if installed.get(key, {}).get("version") != dist["version"]:
+            args.append(f"{dist['name']}=={dist['version']}")
+    return args
+
+def sync_uninstall_names(reference, installed, names=None):
+    """Distributions installed in the target that the reference does not have."""
+    return [
+        dist["name"] for key, dist in sorted(installed.items())
+        if key not in reference
+        and key not in PROTECTED_DISTRIBUTIONS
+        and (names is None or key in names)
+    ]
+
+class EnvironmentMatrixThread(QThread):
+    matrix_ready_signal = pyqtSignal(dict, dict)
+
+    def __init__(self, targets):
+        super().__init__()
+        self.targets = targets
+
+    def run(self):
+        matrix = {}
+        errors = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(self.targets))) as executor:
+            futures = {executor.submit(installed_distributions, target): target for target in self.targets}
+            for future in as_completed(futures):
+                target = futures[future]
+                try:
+                    matrix[target] = future.result()
+                except (OSError, subprocess.CalledProcessError, ValueError) as e:
+                    errors[target] = str(e)
+        self.matrix_ready_signal.emit(matrix, errors)
+
+# === Requirements Ingestion ===
+def strip_requirement_comment(line):
+    """Remove a pip-style trailing comment (a '#' at the start or after whitespace)."""
+    return re.split(r"(^|\s+)#", line, maxsplit=1)[0].strip()
+
+def parse_requirements_file(path, constraint=False, seen=None):
+    """Parse a requirements or constraints file, following -r and -c includes.
+
+    Returns a dict with "requirements" and "constraints" lists of
+    (Requirement, origin) pairs, the constraint files to pass to pip, and the
+    lines that could not be checked.
+    """
+    result = {"requirements": [], "constraints": [], "constraint_files": [], "skipped": []}
+    seen = set() if seen is None else seen
+    path = os.path.abspath(path)
+    if path in seen:
+        return result
+    seen.add(path)
+    if constraint:
+        result["constraint_files"].append(path)
+
+    logical_lines = []
+    with open(path, encoding="utf-8") as fh:
+        pending, start_number = "", None
+        for line_number, raw_line in enumerate(fh, start=1):
+            raw_line = raw_line.rstrip("\r\n")
+            start_number = start_number or line_number
+            if raw_line.endswith("\\"):
+                pending += raw_line[:-1] + " "
+                continue
+            logical_lines.append((start_number, pending + raw_line))
+            pending, start_number = "", None
+        if pending:
+            logical_lines.append((start_number, pending))
+    for line_number, raw_line in logical_lines:
+        line = strip_requirement_comment(raw_line)
+        if not line:
+            continue
+        origin = f"{os.path.basename(path)}:{line_number}"
+        include = re.match(r"(-r|--requirement|-c|--constraint)(?:\s+|=)(\S+)$", line)
+        if include:
+            nested_path = os.path.join(os.path.dirname(path), include.group(2))
+            nested = parse_requirements_file(
+                nested_path, constraint or include.group(1) in ("-c", "--constraint"), seen
+            )
+            for key in result:
+                result[key].extend(nested[key])
+            continue
+        if line.startswith("-"):
+            # Index and install options (-i, --extra-index-url, -e, ...) are not requirements
+            if line.startswith(("-e", "--editable")):
+                result["skipped"].append(f"{origin}: {line}")
+            continue
+        # Per-requirement options such as --hash are irrelevant to the check
+        line = re.split(r"\s+--", line, maxsplit=1)[0]
+        try:
+            requirement = Requirement(line)
+        except InvalidRequirement:
+            result["skipped"].append(f"{origin}: {line}")
+            continue
+        result["constraints" if constraint else "requirements"].append((requirement, origin))
+    return result
+
+def parse_pyproject_dependencies(path):
+    """Read [project].dependencies from a pyproject.toml file."""
+    result = {"requirements": [], "constraints": [], "constraint_files": [], "skipped": []}
+    if tomllib is None:
+        raise RuntimeError("Reading pyproject.toml requires Python 3.11+ or the 'tomli' package.")
+    with open(path, "rb") as fh:
+        data = tomllib.load(fh)
+    for index, line in enumerate(data.get("project", {}).get("dependencies", []), start=1):
+        origin = f"{os.path.basename(path)}:dependencies[{index}]"
+        try:
+            result["requirements"].append((Requirement(line), origin))
+        except InvalidRequirement:
+            result["skipped"].append(f"{origin}: {line}")
+    return result
+
+def load_requirement_sources(paths):
+    """Merge requirements and constraints from requirements files and pyproject.toml files."""
+    merged = {"requirements": [], "constraints": [], "constraint_files": [], "skipped": []}
+    for path in paths:
+        if os.path.basename(path) == "pyproject.toml":
+            parsed = parse_pyproject_dependencies(path)
+        else:
+            parsed = parse_requirements_file(path, constraint="constraint" in os.path.basename(path).lower())
+        for key in merged:
+            merged[key].extend(parsed[key])
+    return merged
+
+def read_requires_dist(metadata_path):
+    """Return the Requires-Dist entries of an installed distribution."""
+    if os.path.isdir(metadata_path):
+        if metadata_path.endswith(".dist-info"):
+            metadata_file = os.path.join(metadata_path, "METADATA")
+        else:
+            requires_file = os.path.join(metadata_path, "requires.txt")
+            return read_egg_requires(requires_file)
+    else:
+        metadata_file = metadata_path
+    requires = []
+    try:
+        with open(metadata_file, encoding="utf-8", errors="replace") as fh:
+            for line in fh:
+                if not line.strip():
+                    break
+                if line.startswith("Requires-Dist:"):
+                    requires.append(line.split(":", 1)[1].strip())
+    except OSError:
+        pass
+    return requires
+
+def read_egg_requires(requires_file):
+    """Translate an egg-info requires.txt into Requires-Dist style strings."""
+    requires = []
+    section_marker = ""
+    try:
+        with open(requires_file, encoding="utf-8", errors="replace") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                if line.startswith("["):
+                    extra, _, marker = line.strip("[]").partition(":")
+                    conditions = [f'extra == "{extra}"'] if extra else []
+                    if marker:
+                        conditions.append(f"({marker})")
+                    section_marker = " and ".join(conditions)
+                    continue
+                requires.append(f"{line}; {section_marker}" if section_marker else line)
+    except OSError:
+        pass
+    return requires
+
+def check_requirements(target, requirements, constraints=()):
+    """Check requirements against a target with a single metadata scan.
+
+    Requirements whose markers do not apply to the target interpreter are
+    ignored, constraints narrow the specifiers of required names, and the
+    dependencies pulled in by requested extras are checked too. Returns the
+    minimal list of unsatisfied requirements, one per distribution.
+    """
+    interpreter = get_interpreter_info(sys.executable if target.startswith("custom:") else target)
+    environment = dict(interpreter["markers"], extra="")
+    installed = installed_distributions(target)
+
+    wanted = {}
+    pending = deque((requirement, origin, "") for requirement, origin in requirements)
+    while pending:
+        requirement, origin, extra = pending.popleft()
+        if requirement.marker and not requirement.marker.evaluate(dict(environment, extra=extra)):
+            continue
+        key = normalize_name(requirement.name)
+        entry = wanted.setdefault(key, {
+            "name": requirement.name, "specifier": SpecifierSet(), "extras": set(),
+            "url": None, "origins": [],
+        })
+        entry["specifier"] &= requirement.specifier
+        new_extras = set(requirement.extras) - entry["extras"]
+        entry["extras"] |= new_extras
+        entry["url"] = entry["url"] or requirement.url
+        entry["origins"].append(origin)
+        dist = installed.get(key)
+        if dist and new_extras:
+            for line in read_requires_dist(dist["path"]):
+                try:
+                    dependency = Requirement(line)
+                except InvalidRequirement:
+                    continue
+                if not dependency.marker or "extra" not in str(dependency.marker):
+                    continue  # Base dependencies, not something the extra adds
+                for requested_extra in new_extras:
+                    if dependency.marker.evaluate(dict(environment, extra=requested_extra)):
+                        pending.append((dependency, f"{requirement.name}[{requested_extra}]", requested_extra))
+
+    for requirement, origin in constraints:
+        key = normalize_name(requirement.name)
+        if key in wanted and (not requirement.marker or requirement.marker.evaluate(environment)):
+            wanted[key]["specifier"] &= requirement.specifier
+            wanted[key]["origins"].append(origin)
+
+    unsatisfied = []
+    for key, entry in sorted(wanted.items()):
+        dist = installed.get(key)
+        installed_version = dist["version"] if dist else None
+        if installed_version and entry["url"] is None:
+            try:
+                if entry["specifier"].contains(installed_version, prereleases=True):
+                    continue
+            except InvalidVersion:
+                pass
+        elif installed_version:
+            continue
+        extras = f"[{','.join(sorted(entry['extras']))}]" if entry["extras"] else ""
+        if entry["url"]:
+            requirement_text = f"{entry['name']}{extras} @ {entry['url']}"
+        else:
+            requirement_text = f"{entry['name']}{extras}{entry['specifier']}"
+        unsatisfied.append({
+            "name": entry["name"],
+            "requirement": requirement_text,
+            "installed": installed_version,
+            "origins": entry["origins"],
+        })
+    return unsatisfied
+
+class RequirementCheckerThread(QThread):
+    result_signal = pyqtSignal(list)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self, sources, python_exec):
+        super().__init__()
+        self.sources = sources
+        self.python_exec = python_exec
+
+    def run(self):
+        try:
+            unsatisfied = check_requirements(
+                self.python_exec, self.sources["requirements"], self.sources["constraints"]
+            )
+        except (OSError, subprocess.CalledProcessError, ValueError) as e:
+            self.error_signal.emit(str(e))
+            return
+        self.result_signal.emit(unsatisfied)
+
+# === Import-Cost Profiler ===
+IMPORTTIME_PATTERN = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( +)(\S+)")
+
+def parse_importtime(output):
+    """Parse `python -X importtime` output into rows in the order Python printed them."""
+    rows = []
+    for line in output.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            rows.append({
+                "module": match.group(4),
+                "self_us": int(match.group(1)),
+                "cumulative_us": int(match.group(2)),
+                "depth": (len(match.group(3)) - 1) // 2,
+            })
+    return rows
+
+def summarize_import(rows, module):
+    """Aggregate the rows that belong to `import module`, skipping interpreter start-up.
+
+    Python prints each module after its dependencies, so the import is the
+    block of rows ending at the top-level row for `module`.
+    """
+    end = max((i for i, row in enumerate(rows) if row["module"] == module and row["depth"] == 0), default=None)
+    if end is None:
+        return None
+    start = end
+    while start > 0 and rows[start - 1]["depth"] > 0:
+        start -= 1
+    block = rows[start:end + 1]
+    heaviest = sorted(block[:-1], key=lambda row: row["self_us"], reverse=True)[:3]
+    return {
+        "module": module,
+        "self_us": rows[end]["self_us"],
+        "cumulative_us": rows[end]["cumulative_us"],
+        "modules_imported": len(block),
+        "heaviest": [(row["module"], row["self_us"]) for row in heaviest],
+    }
+
+def profile_import(python_exec, module, runs=3):
+    """Measure `import module` in a fresh interpreter, keeping the fastest of a few runs.
+
+    Results are cached per module and environment fingerprint, so a report
+    for an unchanged environment is served from disk.
+    """
+    key = hashlib.sha256(f"{environment_fingerprint(python_exec)}:{module}".encode("utf-8")).hexdigest()
+    cache_path = os.path.join(IMPORT_PROFILE_CACHE_DIR, f"{key}.json")
+    try:
+        with open(cache_path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        pass
+
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [python_exec, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, errors="replace"
+        )
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed"
+            return {"module": module, "error": error}
+        summary = summarize_import(parse_importtime(result.stderr), module)
+        if summary and (best is None or summary["cumulative_us"] < best["cumulative_us"]):
+            best = summary
+    if best is None:
+        # Already imported at start-up (e.g. a site-level module)
+        best = {"module": module, "self_us": 0, "cumulative_us": 0, "modules_imported": 0, "heaviest": []}
+
+    os.makedirs(IMPORT_PROFILE_CACHE_DIR, exist_ok=True)
+    with open(cache_path + ".tmp", "w", encoding="utf-8") as fh:
+        json.dump(best, fh)
+    os.replace(cache_path + ".tmp", cache_path)
+    return best
+
+def distribution_top_level_modules(dist):
+    """Importable top-level module names provided by an installed distribution."""
+    path = dist["path"]
+    modules = []
+    try:
+        with open(os.path.join(path, "top_level.txt"), encoding="utf-8") as fh:
+            modules = [line.strip() for line in fh if line.strip()]
+    except OSError:
+        try:
+            with open(os.path.join(path, "RECORD"), encoding="utf-8") as fh:
+                for line in fh:
+                    parts = line.split(",")[0].split("/")
+                    if parts[0].startswith("..") or parts[0].endswith((".dist-info", ".data")):
+                        continue
+                    if len(parts) > 1 and parts[1] == "__init__.py":
+                        modules.append(parts[0])
+                    elif len(parts) == 1 and parts[0].endswith(".py"):
+                        modules.append(parts[0][:-3])
+        except OSError:
+            pass
+    modules = sorted({module.replace("/", ".") for module in modules if not module.startswith("_")})
+    return modules or [dist["name"].replace("-", "_").lower()]
+
+class ImportProfilerThread(QThread):
+    progress_signal = pyqtSignal(int)
+    report_ready_signal = pyqtSignal(list)
+
+    def __init__(self, python_exec, modules):
+        super().__init__()
+        self.python_exec = python_exec
+        self.modules = modules
+
+    def run(self):
+        report = []
+        # Leave headroom so parallel imports don't skew each other's timings too much
+        workers = max(1, min(len(self.modules), (os.cpu_count() or 2) // 2))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(profile_import, self.python_exec, module): module for module in self.modules}
+            for processed, future in enumerate(as_completed(futures), start=1):
+                try:
+                    report.append(future.result())
+                except (OSError, subprocess.CalledProcessError, ValueError) as e:
+                    report.append({"module": futures[future], "error": str(e)})
+                self.progress_signal.emit(int((processed / len(futures)) * 100))
+        self.report_ready_signal.emit(report)
+
+# === Linked Environments ===
+_store_lock = threading.Lock()
+
+@contextmanager
+def store_lock():
+    """Exclusive lock on the store, across threads and SuperPIP processes."""
+    os.makedirs(STORE_DIR, exist_ok=True)
+    with _store_lock, open(STORE_LOCK_PATH, "a+b") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            fh.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ~10 s; keep waiting
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+def load_store_refs():
+    try:
+        with open(STORE_REFS_PATH, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
         return {}
 
+def save_store_refs(refs):
+    os.makedirs(STORE_DIR, exist_ok=True)
+    with open(STORE_REFS_PATH + ".tmp", "w", encoding="utf-8") as fh:
+        json.dump(refs, fh, indent=2)
+    os.replace(STORE_REFS_PATH + ".tmp", STORE_REFS_PATH)
+
+def set_store_ref(env_dir, entry):
+    """Record (or, with None, forget) the store keys an environment uses."""
+    with store_lock():
+        refs = load_store_refs()
+        if entry is None:
+            refs.pop(os.path.abspath(env_dir), None)
+        else:
+            refs[os.path.abspath(env_dir)] = entry
+        save_store_refs(refs)
+
+def venv_python(env_dir):
+    if sys.platform == "win32":
+        return os.path.join(env_dir, "Scripts", "python.exe")
+    return os.path.join(env_dir, "bin", "python")
+
+def venv_version(env_dir):
+    """Python version recorded in a venv's pyvenv.cfg, without starting it."""
+    try:
+        with open(os.path.join(env_dir, "pyvenv.cfg"), encoding="utf-8") as fh:
+            for line in fh:
+                key, _, value = line.partition("=")
+                if key.strip() in ("version", "version_info"):
+                    return value.strip()
+    except OSError:
+        pass
+    return "unknown"
+
+def linked_environments():
+    """Environments created from the store that still exist, as {label: python}.
+
+    Labels include the full environment path, so environments that share a
+    folder name stay distinct.
+    """
+    environments = {}
+    for env_dir in load_store_refs():
+        python_exec = venv_python(env_dir)
+        if os.path.exists(python_exec):
+            environments[f"Python {venv_version(env_dir)} (linked venv: {env_dir})"] = python_exec
+    return environments
+
+def store_object_key(entry, interpreter):
+    """Content address of a resolved distribution.
+
+    Wheels are keyed by their archive hash. Anything pip has to build is keyed
+    by what was requested plus the interpreter, since the built wheel may be
+    specific to it.
+    """
+    download_info = entry.get("download_info", {})
+    url = download_info.get("url", "")
+    sha256 = download_info.get("archive_info", {}).get("hashes", {}).get("sha256")
+    if sha256 and url.split("#")[0].endswith(".whl"):
+        return sha256
+    metadata = entry.get("metadata", {})
+    payload = f"{metadata.get('name')}=={metadata.get('version')}|{url}|{interpreter['version']}|{interpreter['platform']}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def add_to_store(python_exec, entry, key):
+    """Fetch (or build) the wheel for a resolved entry and unpack it into the store.
+
+    Returns True when the object was added, False when it was already present.
+    """
+    object_dir = os.path.join(STORE_OBJECTS_DIR, key)
+    if os.path.isdir(object_dir):
+        return False
+    metadata = entry.get("metadata", {})
+    if entry.get("is_direct"):
+        spec = entry["download_info"]["url"]
+    else:
+        spec = f"{metadata['name']}=={metadata['version']}"
+    os.makedirs(STORE_OBJECTS_DIR, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=STORE_OBJECTS_DIR, prefix=f".tmp-{key[:12]}-") as tmp_dir:
+        wheel_dir = os.path.join(tmp_dir, "wheel")
+        result = subprocess.run(
+            [python_exec, "-m", "pip", "wheel", "--no-deps", "--quiet", *pip_index_args(), "-w", wheel_dir, spec],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Could not get a wheel for {spec}: {result.stderr.strip()}")
+        wheel_file = next(name for name in os.listdir(wheel_dir) if name.endswith(".whl"))
+        unpack_dir = os.path.join(tmp_dir, "unpacked")
+        with zipfile.ZipFile(os.path.join(wheel_dir, wheel_file)) as archive:
+            archive.extractall(unpack_dir)
+        with open(os.path.join(unpack_dir, STORE_OBJECT_META), "w", encoding="utf-8") as fh:
+            json.dump({"name": metadata.get("name"), "version": metadata.get("version"), "wheel": wheel_file}, fh)
+        try:
+            os.rename(unpack_dir, object_dir)
+        except OSError:
+            if not os.path.isdir(object_dir):  # Not just a concurrent add of the same object
+                raise
+            return False
+    return True
+
+def reflink_file(src, dst):
+    """Copy-on-write clone of a file (Linux FICLONE); raises OSError where unsupported.
+
+    `dst` must not exist yet, so a failed clone never truncates an existing file.
+    """
+    if fcntl is None:
+        raise OSError("reflinks are not supported on this platform")
+    ficlone = 0x40049409
+    try:
+        with open(src, "rb") as source, open(dst, "xb") as destination:
+            fcntl.ioctl(destination.fileno(), ficlone, source.fileno())
+    except OSError:
+        if os.path.exists(dst):
+            os.remove(dst)
+        raise
+
+def temporary_sibling(path):
+    """A fresh, unused path next to `path` for write-then-rename."""
+    return f"{path}.superpip-{os.getpid()}-{threading.get_ident()}.tmp"
+
+def replace_file(dst, write):
+    """Create `dst` through a temporary sibling and os.replace.
+
+    An existing `dst` may be a hardlink into the store, so it is only ever
+    swapped out, never opened for writing.
+    """
+    tmp = temporary_sibling(dst)
+    try:
+        result = write(tmp)
+        os.replace(tmp, dst)
+        return result
+    except BaseException:
+        if os.path.lexists(tmp):
+            os.remove(tmp)
+        raise
+
+def link_file(src, dst):
+    """Hardlink, else reflink, else copy a file. Returns the method used.
+
+    Falls back only when hardlinking is impossible (another filesystem, not
+    permitted, or too many links).
+    """
+    def link(tmp):
+        try:
+            os.link(src, tmp)
+            return "hardlink"
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                raise
+        try:
+            reflink_file(src, tmp)
+            shutil.copystat(src, tmp)
+            return "reflink"
+        except OSError:
+            shutil.copy2(src, tmp)
+            return "copy"
+    return replace_file(dst, link)
+
+def write_private_file(path, content, mode=0o755):
+    with open(path, "xb") as fh:
+        fh.write(content)
+    os.chmod(path, mode)
+
+def write_console_scripts(entry_points_path, scripts_dir, python_exec):
+    """Generate console_scripts launchers for a linked distribution (POSIX only)."""
+    if sys.platform == "win32" or not os.path.exists(entry_points_path):
+        return
+    parser = configparser.ConfigParser(delimiters=("=",))
+    parser.optionxform = str
+    parser.read(entry_points_path, encoding="utf-8")
+    if not parser.has_section("console_scripts"):
+        return
+    for name, target in parser.items("console_scripts"):
+        module, _, attribute = target.partition(":")
+        attribute = attribute.split("[")[0].strip()
+        script_path = os.path.join(scripts_dir, name.strip())
+        content = (
+            f"#!{python_exec}\n"
+            "import sys\n"
+            f"from {module.strip()} import {attribute.split('.')[0]}\n"
+            "if __name__ == '__main__':\n"
+            f"    sys.exit({attribute}())\n"
+        )
+        replace_file(script_path, lambda tmp, content=content: write_private_file(tmp, content.encode("utf-8")))
+
+def link_store_object(key, paths, python_exec):
+    """Materialize one store object in an environment. Returns per-method file counts."""
+    object_dir = os.path.join(STORE_OBJECTS_DIR, key)
+    dist_info = next(name for name in os.listdir(object_dir) if name.endswith(".dist-info"))
+    root_dir = paths["platlib"]
+    with open(os.path.join(object_dir, dist_info, "WHEEL"), encoding="utf-8") as fh:
+        if any(line.strip().lower() == "root-is-purelib: true" for line in fh):
+            root_dir = paths["purelib"]
+    scheme_dirs = {
+        "purelib": paths["purelib"], "platlib": paths["platlib"],
+        "scripts": paths["scripts"], "data": paths["data"],
+        "headers": os.path.join(paths["data"], "include"),
+    }
+
+    counts = {}
+    for root, _, files in os.walk(object_dir):
+        relative_root = os.path.relpath(root, object_dir)
+        parts = [] if relative_root == "." else relative_root.split(os.sep)
+        is_data = bool(parts) and parts[0].endswith(".data")
+        if is_data:
+            # <name>-<version>.data/<scheme>/... goes to that install scheme
+            if len(parts) < 2 or parts[1] not in scheme_dirs:
+                continue
+            dst_dir = os.path.join(scheme_dirs[parts[1]], *parts[2:])
+        else:
+            dst_dir = os.path.join(root_dir, *parts)
+        os.makedirs(dst_dir, exist_ok=True)
+        for filename in files:
+            if not parts and filename == STORE_OBJECT_META:
+                continue
+            src = os.path.join(root, filename)
+            dst = os.path.join(dst_dir, filename)
+            if is_data and parts[1] == "scripts":
+                # Scripts get their '#!python' placeholder rewritten, so they are private copies
+                with open(src, "rb") as fh:
+                    content = fh.read()
+                if content.startswith(b"#!python"):
+                    content = b"#!" + python_exec.encode() + content[len(b"#!python"):]
+                replace_file(dst, lambda tmp: write_private_file(tmp, content))
+                method = "copy"
+            else:
+                method = link_file(src, dst)
+            counts[method] = counts.get(method, 0) + 1
+
+    # Per-environment INSTALLER marker, swapped in so a linked store file is never written through
+    installer_path = os.path.join(root_dir, dist_info, "INSTALLER")
+    replace_file(installer_path, lambda tmp: write_private_file(tmp, b"superpip\n", 0o644))
+    write_console_scripts(os.path.join(object_dir, dist_info, "entry_points.txt"), paths["scripts"], python_exec)
+    return counts
+
+def create_linked_environment(python_exec, env_dir, requirements, progress=None):
+    """Create a venv and fill it from the shared store of unpacked wheels.
+
+    Distributions already in the store are hardlinked (or reflinked, or copied
+    across filesystems) instead of downloaded and installed again. Linked files
+    are shared between environments, so they must not be edited in place.
+    """
+    if os.path.lexists(env_dir):
+        raise FileExistsError(f"'{env_dir}' already exists")
+    progress = progress or (lambda percent, message: None)
+    started = time.monotonic()
+    interpreter = get_interpreter_info(python_exec)
+
+    progress(5, "Resolving")
+    report = run_pip_report(python_exec, ["pip", *requirements], ["--ignore-installed"])
+    entries = report.get("install", [])
+    keys = [store_object_key(entry, interpreter) for entry in entries]
+
+    # Register the keys before adding anything, so a concurrent garbage
+    # collection (from any SuperPIP process) keeps them while we build
+    set_store_ref(env_dir, {"keys": keys, "registered": time.time(), "complete": False})
+    try:
+        progress(15, "Filling store")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            added = sum(executor.map(lambda item: add_to_store(python_exec, *item), zip(entries, keys)))
+
+        progress(60, "Creating venv")
+        subprocess.run([python_exec, "-m", "venv", "--without-pip", env_dir], check=True, capture_output=True)
+        env_python = venv_python(env_dir)
+        paths = json.loads(subprocess.check_output(
+            [env_python, "-c", "import json, sysconfig; print(json.dumps(sysconfig.get_paths()))"], text=True
+        ))
+
+        counts = {}
+        for index, key in enumerate(keys, start=1):
+            progress(60 + int(35 * index / max(len(keys), 1)), "Linking")
+            for method, count in link_store_object(key, paths, env_python).items():
+                counts[method] = counts.get(method, 0) + count
+
+        set_store_ref(env_dir, {"keys": keys, "registered": time.time(), "complete": True})
+    except BaseException:
+        # env_dir did not exist before this build, so everything in it is ours
+        shutil.rmtree(env_dir, ignore_errors=True)
+        set_store_ref(env_dir, None)
+        raise
+
+    progress(100, "Done")
+    return {
+        "python": env_python,
+        "packages": len(keys),
+        "added_to_store": added,
+        "reused_from_store": len(keys) - added,
+        "files": counts,
+        "seconds": time.monotonic() - started,
+    }
+
+def collect_store_garbage():
+    """Delete store objects that no linked environment references.
+
+    Environments whose interpreter is gone are forgotten, unless their build
+    has not completed and was registered recently. Leftover .tmp-* folders
+    from crashed builds are removed once they are older than the same grace
+    period. Returns the number of entries removed and the bytes freed.
+    """
+    now = time.time()
+    with store_lock():
+        refs = {
+            env_dir: entry for env_dir, entry in load_store_refs().items()
+            if os.path.exists(venv_python(env_dir))
+            or (not entry.get("complete") and now - entry["registered"] < STORE_PENDING_TTL)
+        }
+        save_store_refs(refs)
+        referenced = {key for entry in refs.values() for key in entry["keys"]}
+        removed, freed = 0, 0
+        try:
+            entries = list(os.scandir(STORE_OBJECTS_DIR))
+        except OSError:
+            entries = []
+        for entry in entries:
+            if entry.name.startswith(".tmp-"):
+                try:
+                    if now - entry.stat().st_mtime < STORE_PENDING_TTL:
+                        continue  # Possibly an add in progress
+                except OSError:
+                    continue
+            elif entry.name in referenced:
+                continue
+            for root, _, files in os.walk(entry.path):
+                for filename in files:
+                    try:
+                        stat = os.stat(os.path.join(root, filename))
+                    except OSError:
+                        continue
+                    if stat.st_nlink == 1:  # Still hardlinked elsewhere means no space is freed
+                        freed += stat.st_size
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed += 1
+    return removed, freed
+
+class EnvironmentBuilderThread(QThread):
+    progress_signal = pyqtSignal(int, str)
+    finished_signal = pyqtSignal(dict, str)
+
+    def __init__(self, python_exec, env_dir, requirements):
+        super().__init__()
+        self.python_exec = python_exec
+        self.env_dir = env_dir
+        self.requirements = requirements
+
+    def run(self):
+        try:
+            stats = create_linked_environment(
+                self.python_exec, self.env_dir, self.requirements, self.progress_signal.emit
+            )
+        except Exception as e:
+            self.finished_signal.emit({}, str(e) or e.__class__.__name__)
+            return
+        self.finished_signal.emit(stats, "")
+
+class StoreGarbageCollectorThread(QThread):
+    finished_signal = pyqtSignal(dict, str)
+
+    def run(self):
+        try:
+            removed, freed = collect_store_garbage()
+        except Exception as e:
+            self.finished_signal.emit({}, str(e) or e.__class__.__name__)
+            return
+        self.finished_signal.emit({"removed": removed, "freed": freed}, "")
+
 # === Module Checker Thread ===
 class ModuleCheckerThread(QThread):
     missing_modules_signal = pyqtSignal(list)
@@ -269,7 +1819,8 @@ class ModuleCheckerThread(QThread):
         else:
             self.all_modules_installed_signal.emit()
 
-    def parse_imports(self, imports_text):
+    @staticmethod
+    def parse_imports(imports_text):
         import_statements = imports_text.strip().split('\n')
         module_names = set()
         for line in import_statements:
@@ -295,6 +1846,16 @@ class ModuleCheckerThread(QThread):
         except subprocess.CalledProcessError:
             return False
 
+class NumericTableWidgetItem(QTableWidgetItem):
+    """Table item that sorts by its numeric value instead of its text."""
+
+    def __init__(self, text, value):
+        super().__init__(text)
+        self.setData(Qt.UserRole, value)
+
+    def __lt__(self, other):
+        return self.data(Qt.UserRole) < other.data(Qt.UserRole)
+
 # === Main GUI Application ===
 class LibraryDownloader(QMainWindow):
     def __init__(self):
@@ -333,6 +1894,13 @@ class LibraryDownloader(QMainWindow):
         search_layout.addWidget(self.search_input)
         search_layout.addWidget(self.search_button)
 
+        # Index Source Selection
+        self.index_source_label = QLabel(f"Index: {describe_index_source()}")
+        self.index_source_button = QPushButton("Index Source...")
+        self.index_source_button.clicked.connect(self.configure_index_source)
+        search_layout.addWidget(self.index_source_label)
+        search_layout.addWidget(self.index_source_button)
+
         # Filter Dropdown
         self.filter_dropdown = QComboBox()
         self.filter_dropdown.addItems(["Popular Libraries", "All Libraries"])
@@ -353,56 +1921,132 @@ class LibraryDownloader(QMainWindow):
         self.view_installed_button.setEnabled(False)
         self.view_installed_button.clicked.connect(self.view_installed_libraries)
 
+        # Compare Environments Button
+        self.compare_envs_button = QPushButton("Compare Environments")
+        self.compare_envs_button.setEnabled(False)
+        self.compare_envs_button.clicked.connect(self.compare_environments)
+
         python_layout.addWidget(self.check_installs_button)
         python_layout.addWidget(self.python_dropdown)
         python_layout.addWidget(self.view_installed_button)
+        python_layout.addWidget(self.compare_envs_button)
+
+        # Linked Environment Buttons
+        env_layout = QHBoxLayout()
+        self.create_env_button = QPushButton("Create Linked Environment...")
+        self.create_env_button.clicked.connect(self.create_environment)
+        self.store_gc_button = QPushButton("Clean Package Store")
+        self.store_gc_button.clicked.connect(self.clean_package_store)
+        self.env_progress_bar = QProgressBar()
+        self.env_progress_bar.setVisible(False)
+        env_layout.addWidget(self.create_env_button)
+        env_layout.addWidget(self.store_gc_button)
+        env_layout.addWidget(self.env_progress_bar)
 
         # Table for Listing Libraries
         self.library_table = QTableWidget()
-        self.library_table.setColumnCount(3)
-        self.library_table.setHorizontalHeaderLabels(["Library Name", "Install Command", "Info"])
-        self.library_table.setColumnWidth(0, 400)
-        self.library_table.setColumnWidth(1, 250)
-        self.library_table.setColumnWidth(2, 100)
+        self.library_table.setColumnCount(6)
+        self.library_table.setHorizontalHeaderLabels(
+            ["Library Name", "Install Command", "Summary", "Latest", "Released", "Info"]
+        )
+        self.library_table.setColumnWidth(0, 200)
+        self.library_table.setColumnWidth(1, 200)
+        self.library_table.setColumnWidth(2, 300)
+        self.library_table.setColumnWidth(3, 80)
+        self.library_table.setColumnWidth(4, 90)
+        self.library_table.setColumnWidth(5, 60)
         self.library_table.setSelectionBehavior(QTableWidget.SelectRows)
         self.library_table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.library_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.library_table.verticalScrollBar().valueChanged.connect(self.on_scroll)
 
+        # Inline PyPI metadata, prefetched for visible rows once scrolling settles
+        self.metadata_cache = PackageMetadataCache()
+        self.metadata_fetcher = PackageMetadataFetcher(self.metadata_cache)
+        self.metadata_fetcher.metadata_ready_signal.connect(self.update_metadata_row)
+        self.metadata_fetcher.start()
+        self.metadata_prefetch_timer = QTimer(self)
+        self.metadata_prefetch_timer.setSingleShot(True)
+        self.metadata_prefetch_timer.setInterval(150)
+        self.metadata_prefetch_timer.timeout.connect(self.prefetch_visible_metadata)
+        self.package_rows = {}
+
         # Install Button
         self.install_button = QPushButton("Install Selected")
         self.install_button.clicked.connect(self.install_selected_library)
 
+        # Dry-run Plan Button
+        self.plan_button = QPushButton("Plan Install (Dry Run)")
+        self.plan_button.clicked.connect(self.plan_selected_library)
+
         # Progress Bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(False)
 
         install_layout.addWidget(self.install_button)
+        install_layout.addWidget(self.plan_button)
         install_layout.addWidget(self.progress_bar)
 
         main_layout.addLayout(search_layout)
         main_layout.addWidget(self.filter_dropdown)
         main_layout.addLayout(python_layout)
+        main_layout.addLayout(env_layout)
         main_layout.addWidget(self.library_table)
         main_layout.addLayout(install_layout)
         self.tab1.setLayout(main_layout)
 
         # Load packages
         self.curated_packages = fetch_curated_packages()
+        self.current_package_list = []
+        self.current_display_list = []
+        self.search_active = False
+        self.load_limit = 1000
+        self.current_index = 0
+        self.load_catalog()
+
+    def load_catalog(self):
         self.all_packages = fetch_all_packages()
         self.module_to_package = self.curated_packages.copy()
         for mod, pkg in self.all_packages.items():
             if mod not in self.module_to_package:
                 self.module_to_package[mod] = pkg
-
-        self.current_package_list = []
-        self.current_display_list = []
         self.search_active = False
-        self.load_limit = 1000
-        self.current_index = 0
+        self.search_input.clear()
         self.populate_initial_packages()
 
+    def configure_index_source(self):
+        kinds = list(INDEX_SOURCE_KINDS)
+        labels = [INDEX_SOURCE_KINDS[kind] for kind in kinds]
+        current = get_index_source()
+        label, ok = QInputDialog.getItem(
+            self, "Index Source", "Get packages from:", labels, kinds.index(current["kind"]), False
+        )
+        if not ok:
+            return
+        kind = kinds[labels.index(label)]
+        location = ""
+        if kind == "mirror":
+            location, ok = QInputDialog.getText(
+                self, "Mirror URL", "Simple index URL (e.g. https://pypi.internal/simple/):",
+                text=current["location"] if current["kind"] == "mirror" else ""
+            )
+            location = location.strip()
+            if not ok or not location:
+                return
+        elif kind in ("simple-dir", "wheelhouse"):
+            location = QFileDialog.getExistingDirectory(
+                self, f"Select {INDEX_SOURCE_KINDS[kind]}",
+                local_index_path(current["location"]) if current["kind"] == kind else ""
+            )
+            if not location:
+                return
+        set_index_source(kind, location)
+        self.index_source_label.setText(f"Index: {describe_index_source()}")
+        self.load_catalog()
+        if not self.all_packages:
+            QMessageBox.warning(self, "Index Source", f"No packages could be loaded from {describe_index_source()}.")
+
     def init_tab2(self):
         layout = QVBoxLayout()
         python_selection_layout = QHBoxLayout()
@@ -413,16 +2057,29 @@ class LibraryDownloader(QMainWindow):
         python_selection_layout.addWidget(self.module_checker_python_dropdown)
         layout.addLayout(python_selection_layout)
 
-        instructions = QLabel("Paste your import statements below and click 'Check Modules'.")
+        instructions = QLabel(
+            "Paste your import statements below and click 'Check Modules', "
+            "or load requirements/constraints files or a pyproject.toml."
+        )
         layout.addWidget(instructions)
 
         self.imports_text_edit = QTextEdit()
         self.imports_text_edit.setPlaceholderText("Enter import statements here...")
         layout.addWidget(self.imports_text_edit)
 
+        check_buttons_layout = QHBoxLayout()
         self.check_modules_button = QPushButton("Check Modules")
         self.check_modules_button.clicked.connect(self.process_imports)
-        layout.addWidget(self.check_modules_button)
+        check_buttons_layout.addWidget(self.check_modules_button)
+
+        self.load_requirements_button = QPushButton("Load Requirements...")
+        self.load_requirements_button.clicked.connect(self.load_requirements)
+        check_buttons_layout.addWidget(self.load_requirements_button)
+
+        self.profile_imports_button = QPushButton("Profile Import Time")
+        self.profile_imports_button.clicked.connect(self.profile_checker_imports)
+        check_buttons_layout.addWidget(self.profile_imports_button)
+        layout.addLayout(check_buttons_layout)
 
         self.module_checker_progress_bar = QProgressBar()
         self.module_checker_progress_bar.setValue(0)
@@ -431,6 +2088,11 @@ class LibraryDownloader(QMainWindow):
 
         self.missing_modules_list = QListWidget()
         layout.addWidget(self.missing_modules_list)
+
+        self.install_unsatisfied_button = QPushButton("Install Unsatisfied Requirements")
+        self.install_unsatisfied_button.setVisible(False)
+        self.install_unsatisfied_button.clicked.connect(self.install_unsatisfied_requirements)
+        layout.addWidget(self.install_unsatisfied_button)
         self.tab2.setLayout(layout)
 
        # self.populate_module_checker_python_dropdown()
@@ -523,7 +2185,7 @@ class LibraryDownloader(QMainWindow):
 
     def install_module(self, package_name, module_name, python_exec):
         try:
-            subprocess.check_call([python_exec, '-m', 'pip', 'install', package_name])
+            subprocess.check_call(build_pip_install_command(python_exec, [package_name]))
             QMessageBox.information(self, "Success", f"Module '{module_name}' (package '{package_name}') installed successfully.")
         except subprocess.CalledProcessError:
             QMessageBox.critical(self, "Error", f"Failed to install module '{module_name}' (package '{package_name}').")
@@ -538,6 +2200,77 @@ class LibraryDownloader(QMainWindow):
     def update_module_checker_progress(self, progress):
         self.module_checker_progress_bar.setValue(progress)
 
+    def load_requirements(self):
+        if self.module_checker_python_dropdown.currentIndex() <= 0:
+            QMessageBox.warning(self, "Error", "Please select a Python installation from the dropdown.")
+            return
+        paths, _ = QFileDialog.getOpenFileNames(
+            self, "Select Requirements Files", "",
+            "Requirements (*.txt *.in pyproject.toml);;All Files (*)"
+        )
+        if not paths:
+            return
+        try:
+            sources = load_requirement_sources(paths)
+        except (OSError, ValueError, RuntimeError) as e:
+            QMessageBox.critical(self, "Error", f"Failed to read requirements: {e}")
+            return
+        if not sources["requirements"]:
+            QMessageBox.information(self, "No Requirements", "No requirements were found in the selected files.")
+            return
+
+        self.requirement_sources = sources
+        self.selected_module_checker_python_exec = self.module_checker_python_dropdown.currentData()
+        self.check_modules_button.setEnabled(False)
+        self.load_requirements_button.setEnabled(False)
+        self.install_unsatisfied_button.setVisible(False)
+        self.missing_modules_list.clear()
+        self.module_checker_progress_bar.setMaximum(0)  # Busy indicator for the single scan
+        self.module_checker_progress_bar.setVisible(True)
+
+        self.requirement_checker_thread = RequirementCheckerThread(sources, self.selected_module_checker_python_exec)
+        self.requirement_checker_thread.result_signal.connect(self.handle_requirement_results)
+        self.requirement_checker_thread.error_signal.connect(self.handle_requirement_error)
+        self.requirement_checker_thread.start()
+
+    def finish_requirement_check(self):
+        self.check_modules_button.setEnabled(True)
+        self.load_requirements_button.setEnabled(True)
+        self.module_checker_progress_bar.setMaximum(100)
+        self.module_checker_progress_bar.setVisible(False)
+
+    def handle_requirement_error(self, message):
+        self.finish_requirement_check()
+        QMessageBox.critical(self, "Error", f"Failed to check requirements: {message}")
+
+    def handle_requirement_results(self, unsatisfied):
+        self.finish_requirement_check()
+        self.unsatisfied_requirements = unsatisfied
+        for entry in unsatisfied:
+            installed = f"installed {entry['installed']}" if entry["installed"] else "not installed"
+            self.missing_modules_list.addItem(
+                f"{entry['requirement']} - {installed} ({', '.join(entry['origins'])})"
+            )
+        for skipped in self.requirement_sources["skipped"]:
+            self.missing_modules_list.addItem(f"Skipped (not checkable): {skipped}")
+        if unsatisfied:
+            self.install_unsatisfied_button.setVisible(True)
+        else:
+            QMessageBox.information(self, "All Requirements Satisfied", "All requirements are already satisfied.")
+
+    def install_unsatisfied_requirements(self):
+        requirements = [entry["requirement"] for entry in self.unsatisfied_requirements]
+        constraint_args = []
+        for path in self.requirement_sources["constraint_files"]:
+            constraint_args.extend(["-c", path])
+        python_exec = self.selected_module_checker_python_exec
+        try:
+            subprocess.check_call(build_pip_install_command(python_exec, requirements + constraint_args))
+            QMessageBox.information(self, "Success", f"Installed {len(requirements)} requirement(s) successfully.")
+            self.install_unsatisfied_button.setVisible(False)
+        except subprocess.CalledProcessError:
+            QMessageBox.critical(self, "Error", "Failed to install the unsatisfied requirements.")
+
     # === Library Downloader Methods ===
     def populate_initial_packages(self):
         filter_choice = self.filter_dropdown.currentText()
@@ -553,6 +2286,8 @@ class LibraryDownloader(QMainWindow):
     def load_more_packages(self):
         if self.current_index >= len(self.current_package_list):
             return
+        if self.current_index == 0:
+            self.package_rows = {}
         next_index = min(self.current_index + self.load_limit, len(self.current_package_list))
         packages_to_load = self.current_package_list[self.current_index:next_index]
         self.current_display_list.extend(packages_to_load)
@@ -564,13 +2299,49 @@ class LibraryDownloader(QMainWindow):
             self.library_table.setItem(row_position, 1, QTableWidgetItem(f"pip install {pip_package}"))
             info_button = QPushButton("Info")
             info_button.clicked.connect(lambda _, pkg=pip_package: self.open_module_page(pkg))
-            self.library_table.setCellWidget(row_position, 2, info_button)
+            self.library_table.setCellWidget(row_position, 5, info_button)
+            self.package_rows.setdefault(pip_package, []).append(row_position)
         self.current_index = next_index
+        self.metadata_prefetch_timer.start()
 
     def on_scroll(self, value):
         scrollbar = self.library_table.verticalScrollBar()
         if value == scrollbar.maximum() and not self.search_active:
             self.load_more_packages()
+        self.metadata_prefetch_timer.start()  # Restart the debounce while scrolling
+
+    def prefetch_visible_metadata(self):
+        row_count = self.library_table.rowCount()
+        if not row_count or get_index_source()["kind"] != "pypi":
+            self.metadata_fetcher.request_visible([])
+            return
+        first_row = max(self.library_table.rowAt(0), 0)
+        last_row = self.library_table.rowAt(self.library_table.viewport().height() - 1)
+        if last_row < 0:
+            last_row = row_count - 1
+        to_fetch = []
+        for row in range(first_row, last_row + 1):
+            item = self.library_table.item(row, 0)
+            if item is None or self.library_table.item(row, 3) is not None:
+                continue
+            package_name = item.text()
+            cached = self.metadata_cache.get(package_name)
+            if cached:
+                self.update_metadata_row(package_name, cached)
+            else:
+                to_fetch.append(package_name)
+        self.metadata_fetcher.request_visible(to_fetch)
+
+    def update_metadata_row(self, package_name, metadata):
+        for row in self.package_rows.get(package_name, []):
+            name_item = self.library_table.item(row, 0)
+            if name_item is None or name_item.text() != package_name:
+                continue
+            summary_item = QTableWidgetItem(metadata["summary"])
+            summary_item.setToolTip(metadata["summary"])
+            self.library_table.setItem(row, 2, summary_item)
+            self.library_table.setItem(row, 3, QTableWidgetItem(metadata["version"]))
+            self.library_table.setItem(row, 4, QTableWidgetItem(metadata["released"]))
 
     def apply_filter(self):
         self.search_active = False
@@ -591,6 +2362,7 @@ class LibraryDownloader(QMainWindow):
         if not results:
             QMessageBox.information(self, "No Results", f"No libraries found matching '{query}'.")
             self.library_table.setRowCount(0)
+            self.package_rows = {}
             self.current_display_list = []
             self.current_package_list = []
             self.search_active = True
@@ -604,12 +2376,14 @@ class LibraryDownloader(QMainWindow):
 
     def check_python_installations(self):
         self.python_versions = detect_python_versions()
+        self.python_versions.update(linked_environments())
         if not self.python_versions:
             QMessageBox.warning(self, "Error", "No Python installations found.")
             self.python_dropdown.clear()
             self.python_dropdown.addItem("No Python installations detected.")
             self.python_dropdown.setEnabled(False)
             self.view_installed_button.setEnabled(False)
+            self.compare_envs_button.setEnabled(False)
             if hasattr(self, 'module_checker_python_dropdown'):
                 self.module_checker_python_dropdown.clear()
                 self.module_checker_python_dropdown.setEnabled(False)
@@ -624,8 +2398,10 @@ class LibraryDownloader(QMainWindow):
         if hasattr(self, 'module_checker_python_dropdown'):
             self.populate_module_checker_python_dropdown()
         self.view_installed_button.setEnabled(True)
+        self.compare_envs_button.setEnabled(True)
         if hasattr(self, 'finish_loading'):
             self.finish_loading()
+            del self.finish_loading  # The spinner only runs once, at start-up
       #  QMessageBox.information(self, "Python Installations", "Python installations have been detected and listed.")
 
     def on_python_selection_change(self):
@@ -638,56 +2414,260 @@ class LibraryDownloader(QMainWindow):
             else:
                 self.python_dropdown.setCurrentIndex(0)
 
-    def install_selected_library(self):
-        selected_items = self.library_table.selectedItems()
-        if not selected_items:
-            QMessageBox.warning(self, "Error", "Please select a library to install.")
-            return
-        selected_library = selected_items[0].text()
+    def selected_libraries(self):
+        rows = sorted({index.row() for index in self.library_table.selectedIndexes()})
+        return [self.library_table.item(row, 0).text() for row in rows if self.library_table.item(row, 0)]
+
+    def get_install_targets(self):
         selected_python = self.python_dropdown.currentData()
         selected_option = self.python_dropdown.currentText()
         if not selected_python or selected_python == "Select Installation":
             QMessageBox.warning(self, "Error", "Please select a valid Python installation from the dropdown.")
-            return
-        install_targets = []
+            return None
         if selected_option == "Install to All Python Installations":
             if not self.python_versions:
                 QMessageBox.warning(self, "Error", "No Python installations found.")
-                return
-            install_targets = list(self.python_versions.values())
-        elif selected_option.startswith("Custom Directory:"):
+                return None
+            return list(self.python_versions.values())
+        if selected_option.startswith("Custom Directory:"):
             custom_dir = selected_option.split("Custom Directory: ")[1]
-            install_targets = [f"custom:{custom_dir}"]
-        else:
-            install_targets = [selected_python]
+            return [f"custom:{custom_dir}"]
+        return [selected_python]
+
+    def describe_target(self, target):
+        if target.startswith("custom:"):
+            return f"Custom Directory: {target.split('custom:', 1)[1]}"
+        for version, exec_path in getattr(self, "python_versions", {}).items():
+            if exec_path == target:
+                return f"{version} - {exec_path}"
+        return target
+
+    def set_install_controls_enabled(self, enabled):
+        self.install_button.setEnabled(enabled)
+        self.plan_button.setEnabled(enabled)
+        self.check_installs_button.setEnabled(enabled)
+        self.view_installed_button.setEnabled(enabled)
+        self.compare_envs_button.setEnabled(enabled)
+        self.create_env_button.setEnabled(enabled)
+        self.store_gc_button.setEnabled(enabled)
+        if hasattr(self, "apply_plan_button"):
+            self.apply_plan_button.setEnabled(enabled and self.install_plan_applicable)
+        if hasattr(self, "sync_button"):
+            self.sync_button.setEnabled(enabled)
+
+    def install_running(self):
+        return hasattr(self, "pip_install_thread") and self.pip_install_thread.isRunning()
 
-        self.install_button.setEnabled(False)
-        self.check_installs_button.setEnabled(False)
-        self.view_installed_button.setEnabled(False)
+    def install_selected_library(self):
+        selected_libraries = self.selected_libraries()
+        if not selected_libraries:
+            QMessageBox.warning(self, "Error", "Please select a library to install.")
+            return
+        install_targets = self.get_install_targets()
+        if not install_targets:
+            return
+        jobs = []
+        for target in install_targets:
+            # A cached dry-run plan for an unchanged environment is applied
+            # as exact pins, skipping dependency resolution.
+            try:
+                plan = load_cached_plan(target, selected_libraries)
+            except (OSError, subprocess.CalledProcessError, ValueError):
+                plan = None
+            if plan and plan["items"]:
+                jobs.append((target, build_pip_install_command(target, pinned_install_args(plan))))
+            elif plan:
+                continue
+            else:
+                jobs.append((target, build_pip_install_command(target, selected_libraries)))
+        if not jobs:
+            QMessageBox.information(
+                self, "Up to Date",
+                f"{', '.join(selected_libraries)} is already up to date for all targets."
+            )
+            return
+        self.run_install_jobs(jobs, f"Successfully installed {', '.join(selected_libraries)}.")
+
+    def run_install_jobs(self, jobs, success_message):
+        if not jobs:
+            QMessageBox.information(self, "Success", success_message)
+            return
+        if self.install_running():
+            # Replacing the reference would let the running QThread be destroyed
+            QMessageBox.warning(self, "Busy", "Another installation is still running. Please wait for it to finish.")
+            return
+        self.set_install_controls_enabled(False)
         self.progress_bar.setVisible(True)
-        self.progress_bar.setMaximum(len(install_targets))
+        self.progress_bar.setMaximum(len({target for target, _ in jobs}))
         self.progress_bar.setValue(0)
-        errors = []
-        for idx, target in enumerate(install_targets, start=1):
-            if target.startswith("custom:"):
-                custom_path = target.split("custom:")[1]
-                cmd = [sys.executable, "-m", "pip", "install", selected_library, "--target", custom_path]
-            else:
-                cmd = [target, "-m", "pip", "install", selected_library]
-            try:
-                subprocess.run(cmd, check=True)
-            except subprocess.CalledProcessError as e:
-                errors.append(f"Failed to install to {target}: {e}")
-            self.progress_bar.setValue(idx)
-            QApplication.processEvents()
-        self.install_button.setEnabled(True)
-        self.check_installs_button.setEnabled(True)
-        self.view_installed_button.setEnabled(True)
+        self.install_success_message = success_message
+        self.show_install_progress_window()
+
+        self.pip_install_thread = PipInstallThread(jobs)
+        self.pip_install_thread.event_signal.connect(self.handle_pip_event)
+        self.pip_install_thread.log_signal.connect(self.append_install_log)
+        self.pip_install_thread.target_finished_signal.connect(self.handle_install_target_finished)
+        self.pip_install_thread.finished_signal.connect(self.handle_install_jobs_finished)
+        self.pip_install_thread.start()
+
+    def show_install_progress_window(self):
+        window = QWidget()
+        window.setWindowTitle("Install Progress")
+        layout = QVBoxLayout()
+
+        self.install_progress_table = QTableWidget()
+        self.install_progress_table.setColumnCount(5)
+        self.install_progress_table.setHorizontalHeaderLabels(
+            ["Target", "Package", "Stage", "Downloaded", "Throughput"]
+        )
+        self.install_progress_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.install_progress_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.install_progress_rows = {}
+        layout.addWidget(self.install_progress_table)
+
+        self.install_log_view = QPlainTextEdit()
+        self.install_log_view.setReadOnly(True)
+        self.install_log_view.setMaximumBlockCount(INSTALL_LOG_MAX_LINES)
+        layout.addWidget(self.install_log_view)
+
+        window.setLayout(layout)
+        window.resize(800, 500)
+        window.show()
+        self.install_progress_window = window  # Keep a reference
+
+    def install_progress_row(self, target, package):
+        key = (target, normalize_name(package))
+        if key not in self.install_progress_rows:
+            row_position = self.install_progress_table.rowCount()
+            self.install_progress_table.insertRow(row_position)
+            self.install_progress_table.setItem(row_position, 0, QTableWidgetItem(self.describe_target(target)))
+            self.install_progress_table.setItem(row_position, 1, QTableWidgetItem(package))
+            for column in range(2, 5):
+                self.install_progress_table.setItem(row_position, column, QTableWidgetItem(""))
+            self.install_progress_rows[key] = row_position
+        return self.install_progress_rows[key]
+
+    def handle_pip_event(self, target, event):
+        stages = {
+            "collecting": "collecting", "downloading": "downloading", "progress": "downloading",
+            "downloaded": "downloaded", "cached": "cached", "processing": "local file",
+            "building": "building", "satisfied": "already satisfied",
+            "installing": "installing", "installed": "installed", "uninstalled": "uninstalled",
+        }
+        if event["kind"] == "error":
+            self.append_install_log(target, f"ERROR: {event['message']}")
+            return
+        packages = event.get("packages") or [event.get("package")]
+        for package in filter(None, packages):
+            row = self.install_progress_row(target, package)
+            self.install_progress_table.item(row, 2).setText(stages[event["kind"]])
+            if event.get("total") is not None and event["kind"] in ("downloading", "cached", "processing"):
+                self.install_progress_table.item(row, 3).setText(f"0 / {format_size(event['total'])}")
+            if event["kind"] in ("progress", "downloaded"):
+                downloaded = event.get("downloaded") or 0
+                self.install_progress_table.item(row, 3).setText(
+                    f"{format_size(downloaded)} / {format_size(event.get('total'))}"
+                )
+                self.install_progress_table.item(row, 4).setText(f"{format_size(event['rate'])}/s")
+
+    def append_install_log(self, target, line):
+        self.install_log_view.appendPlainText(f"[{self.describe_target(target)}] {line}")
+
+    def handle_install_target_finished(self, target, succeeded):
+        self.progress_bar.setValue(self.progress_bar.value() + 1)
+        self.append_install_log(target, "Finished." if succeeded else "Failed.")
+
+    def handle_install_jobs_finished(self, errors):
+        self.set_install_controls_enabled(True)
         self.progress_bar.setVisible(False)
         if errors:
             QMessageBox.critical(self, "Installation Errors", "\n".join(errors))
         else:
-            QMessageBox.information(self, "Success", f"Successfully installed {selected_library}.")
+            QMessageBox.information(self, "Success", self.install_success_message)
+
+    def plan_selected_library(self):
+        selected_libraries = self.selected_libraries()
+        if not selected_libraries:
+            QMessageBox.warning(self, "Error", "Please select a library to plan.")
+            return
+        install_targets = self.get_install_targets()
+        if not install_targets:
+            return
+        self.set_install_controls_enabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setMaximum(100)
+        self.progress_bar.setValue(0)
+        self.install_plan_thread = InstallPlanThread(install_targets, selected_libraries)
+        self.install_plan_thread.progress_signal.connect(self.progress_bar.setValue)
+        self.install_plan_thread.plans_ready_signal.connect(self.show_install_plan_window)
+        self.install_plan_thread.start()
+
+    def show_install_plan_window(self, plans):
+        self.set_install_controls_enabled(True)
+        self.progress_bar.setVisible(False)
+
+        window = QWidget()
+        window.setWindowTitle("Install Plan (Dry Run)")
+        layout = QVBoxLayout()
+
+        plan_table = QTableWidget()
+        plan_table.setColumnCount(6)
+        plan_table.setHorizontalHeaderLabels(["Target", "Package", "Action", "Installed", "New", "Download Size"])
+        plan_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        plan_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        total_size = 0
+        errors = []
+        for plan in plans:
+            target_label = self.describe_target(plan["target"])
+            if plan.get("error"):
+                errors.append(f"{target_label}: {plan['error']}")
+                continue
+            if not plan["items"]:
+                rows = [[target_label, "", "nothing to do", "", "", ""]]
+            else:
+                rows = [
+                    [target_label, item["name"], item["action"], item["current"] or "",
+                     item["version"], format_size(item["size"])]
+                    for item in plan["items"]
+                ]
+            for values in rows:
+                row_position = plan_table.rowCount()
+                plan_table.insertRow(row_position)
+                for column, value in enumerate(values):
+                    plan_table.setItem(row_position, column, QTableWidgetItem(value))
+            total_size += plan["total_size"]
+        layout.addWidget(plan_table)
+
+        summary = f"Total download size: {format_size(total_size)} across {len(plans) - len(errors)} target(s)."
+        if errors:
+            summary += "\n\nResolution failed for:\n" + "\n".join(errors)
+        layout.addWidget(QLabel(summary))
+
+        buttons_layout = QHBoxLayout()
+        self.install_plan_applicable = any(plan["items"] and not plan.get("error") for plan in plans)
+        self.apply_plan_button = QPushButton("Apply Plan")
+        self.apply_plan_button.setEnabled(self.install_plan_applicable and not self.install_running())
+        self.apply_plan_button.clicked.connect(lambda: self.apply_install_plans(plans))
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(window.close)
+        buttons_layout.addWidget(self.apply_plan_button)
+        buttons_layout.addWidget(close_button)
+        layout.addLayout(buttons_layout)
+
+        window.setLayout(layout)
+        window.resize(800, 450)
+        window.show()
+        self.install_plan_window = window  # Keep a reference
+
+    def apply_install_plans(self, plans):
+        if hasattr(self, "install_plan_window"):
+            self.install_plan_window.close()
+        jobs = [
+            (plan["target"], build_pip_install_command(plan["target"], pinned_install_args(plan)))
+            for plan in plans if plan["items"] and not plan.get("error")
+        ]
+        requirements = ", ".join(plans[0]["requirements"]) if plans and "requirements" in plans[0] else "plan"
+        self.run_install_jobs(jobs, f"Successfully applied the install plan for {requirements}.")
 
     def view_installed_libraries(self):
         selected_python = self.python_dropdown.currentData()
@@ -699,63 +2679,454 @@ class LibraryDownloader(QMainWindow):
             QMessageBox.warning(self, "Error", "Please select a single Python installation to view its libraries.")
             return
         try:
-            result = subprocess.check_output([selected_python, "-m", "pip", "list", "--format=freeze"], text=True)
-            self.show_installed_libraries_window(selected_option, result, selected_python)
-        except subprocess.CalledProcessError:
+            distributions = installed_distributions(selected_python)
+            self.show_installed_libraries_window(selected_option, distributions, selected_python)
+        except (subprocess.CalledProcessError, OSError):
             QMessageBox.critical(self, "Error", f"Failed to retrieve installed libraries for {selected_option}.")
 
-    def show_installed_libraries_window(self, python_version, library_list, python_exec):
+    def show_installed_libraries_window(self, python_version, distributions, python_exec):
         window = QWidget()
         window.setWindowTitle(f"Installed Libraries - {python_version}")
         layout = QVBoxLayout()
 
         # Create a list widget to show installed packages
         self.installed_list_widget = QListWidget()
-        packages = library_list.strip().split('\n')
-        for pkg_line in packages:
-            self.installed_list_widget.addItem(pkg_line)
+        self.installed_list_widget.setSelectionMode(QListWidget.ExtendedSelection)
+        self.installed_distributions = {}
+        self.installed_items = {}
+        self.installed_sort_keys = []  # Parallel to the list rows, for sorted inserts
+        self.apply_installed_libraries_diff(distributions)
         layout.addWidget(self.installed_list_widget)
 
         # Uninstall Button
-        uninstall_button = QPushButton("Uninstall Selected Package")
+        uninstall_button = QPushButton("Uninstall Selected Packages")
         uninstall_button.clicked.connect(lambda: self.uninstall_selected_package(python_exec))
         layout.addWidget(uninstall_button)
 
+        # Import-Cost Profiler Button
+        self.installed_profile_button = QPushButton("Profile Import Time of Selected")
+        self.installed_profile_button.setEnabled(not self.import_profiler_running())
+        self.installed_profile_button.clicked.connect(lambda: self.profile_selected_packages(python_exec))
+        layout.addWidget(self.installed_profile_button)
+        previous_progress_bar = getattr(self, "installed_profile_progress_bar", None)
+        self.installed_profile_progress_bar = QProgressBar()
+        self.installed_profile_progress_bar.setVisible(False)
+        layout.addWidget(self.installed_profile_progress_bar)
+        if self.import_profiler_running() and self.import_profile_progress_bar is previous_progress_bar:
+            # The previous window (and its progress bar) goes away with this one
+            self.import_profile_progress_bar = self.installed_profile_progress_bar
+            self.installed_profile_progress_bar.setVisible(True)
+
         window.setLayout(layout)
         window.resize(600, 400)
         window.show()
         self.installed_libs_window = window  # Keep a reference
+        self.watch_installed_libraries(python_exec)
+
+    def watch_installed_libraries(self, python_exec):
+        # Refresh automatically when anything (pip, conda, another SuperPIP
+        # window...) changes the environment. QFileSystemWatcher uses inotify
+        # and friends where available and falls back to polling elsewhere.
+        if hasattr(self, "installed_libs_watcher"):
+            self.installed_libs_watcher.deleteLater()
+        watched_dirs = []
+        try:
+            site_dirs = get_site_dirs(python_exec)
+        except (OSError, subprocess.CalledProcessError):
+            site_dirs = []
+        for site_dir in site_dirs:
+            try:
+                with os.scandir(site_dir) as entries:
+                    if any(entry.name.endswith((".dist-info", ".egg-info")) for entry in entries):
+                        watched_dirs.append(site_dir)
+            except OSError:
+                continue  # An unreadable directory shouldn't stop the others being watched
+        self.installed_libs_watcher = QFileSystemWatcher(watched_dirs, self)
+        self.installed_libs_refresh_timer = QTimer(self.installed_libs_watcher)
+        self.installed_libs_refresh_timer.setSingleShot(True)
+        self.installed_libs_refresh_timer.setInterval(500)  # Coalesce the bursts pip produces
+        self.installed_libs_refresh_timer.timeout.connect(
+            lambda: self.refresh_installed_libraries(python_exec, quiet=True)
+        )
+        self.installed_libs_watcher.directoryChanged.connect(lambda _: self.installed_libs_refresh_timer.start())
 
     def uninstall_selected_package(self, python_exec):
         selected_items = self.installed_list_widget.selectedItems()
         if not selected_items:
             QMessageBox.warning(self, "Error", "Please select a package to uninstall.")
             return
-        package_line = selected_items[0].text()
-        package_name = package_line.split("==")[0]
+        package_names = [item.text().split("==")[0] for item in selected_items]
         reply = QMessageBox.question(
             self, "Confirm Uninstall",
-            f"Are you sure you want to uninstall '{package_name}'?",
+            f"Are you sure you want to uninstall {len(package_names)} package(s)?\n\n" + "\n".join(package_names),
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No
         )
         if reply == QMessageBox.Yes:
             try:
-                subprocess.check_call([python_exec, "-m", "pip", "uninstall", package_name, "-y"])
-                QMessageBox.information(self, "Success", f"'{package_name}' uninstalled successfully.")
+                subprocess.check_call([python_exec, "-m", "pip", "uninstall", "-y", *package_names])
+                QMessageBox.information(self, "Success", f"{', '.join(package_names)} uninstalled successfully.")
                 # Refresh the list widget
                 self.refresh_installed_libraries(python_exec)
             except subprocess.CalledProcessError:
-                QMessageBox.critical(self, "Error", f"Failed to uninstall '{package_name}'.")
+                QMessageBox.critical(self, "Error", f"Failed to uninstall {', '.join(package_names)}.")
+                self.refresh_installed_libraries(python_exec)
 
-    def refresh_installed_libraries(self, python_exec):
+    def refresh_installed_libraries(self, python_exec, quiet=False):
+        if quiet and not self.installed_libs_window.isVisible():
+            return
         try:
-            result = subprocess.check_output([python_exec, "-m", "pip", "list", "--format=freeze"], text=True)
-            self.installed_list_widget.clear()
-            packages = result.strip().split('\n')
-            for pkg_line in packages:
-                self.installed_list_widget.addItem(pkg_line)
-        except subprocess.CalledProcessError:
-            QMessageBox.critical(self, "Error", "Failed to refresh installed libraries list.")
+            distributions = installed_distributions(python_exec)
+        except (subprocess.CalledProcessError, OSError):
+            if not quiet:
+                QMessageBox.critical(self, "Error", "Failed to refresh installed libraries list.")
+            return
+        self.apply_installed_libraries_diff(distributions)
+
+    def apply_installed_libraries_diff(self, distributions):
+        added, removed, changed = diff_distributions(self.installed_distributions, distributions)
+        for key in removed:
+            row = self.installed_list_widget.row(self.installed_items.pop(key))
+            self.installed_list_widget.takeItem(row)
+            del self.installed_sort_keys[row]
+        for key in changed:
+            dist = distributions[key]
+            self.installed_items[key].setText(f"{dist['name']}=={dist['version']}")
+        for key in added:
+            dist = distributions[key]
+            item = QListWidgetItem(f"{dist['name']}=={dist['version']}")
+            sort_key = dist["name"].lower()
+            row = bisect.bisect_right(self.installed_sort_keys, sort_key)
+            self.installed_sort_keys.insert(row, sort_key)
+            self.installed_list_widget.insertItem(row, item)
+            self.installed_items[key] = item
+        self.installed_distributions = distributions
+
+    # === Import-Cost Profiler Methods ===
+    def profile_selected_packages(self, python_exec):
+        selected_items = self.installed_list_widget.selectedItems()
+        if not selected_items:
+            QMessageBox.warning(self, "Error", "Please select the packages to profile.")
+            return
+        modules = []
+        for item in selected_items:
+            dist = self.installed_distributions.get(normalize_name(item.text().split("==")[0]))
+            if dist:
+                modules.extend(distribution_top_level_modules(dist))
+        self.start_import_profiler(python_exec, sorted(set(modules)), self.installed_profile_progress_bar)
+
+    def profile_checker_imports(self):
+        imports_text = self.imports_text_edit.toPlainText()
+        if not imports_text.strip():
+            QMessageBox.warning(self, "Error", "Please enter import statements.")
+            return
+        if self.module_checker_python_dropdown.currentIndex() <= 0:
+            QMessageBox.warning(self, "Error", "Please select a Python installation from the dropdown.")
+            return
+        modules = sorted(ModuleCheckerThread.parse_imports(imports_text))
+        self.start_import_profiler(
+            self.module_checker_python_dropdown.currentData(), modules, self.module_checker_progress_bar
+        )
+
+    def import_profiler_running(self):
+        return hasattr(self, "import_profiler_thread") and self.import_profiler_thread.isRunning()
+
+    def set_profile_controls_enabled(self, enabled):
+        self.profile_imports_button.setEnabled(enabled)
+        if hasattr(self, "installed_profile_button"):
+            self.installed_profile_button.setEnabled(enabled)
+
+    def start_import_profiler(self, python_exec, modules, progress_bar):
+        if self.import_profiler_running():
+            return  # Both buttons are disabled until the running profile finishes
+        if not modules:
+            QMessageBox.warning(self, "Error", "No importable modules were found to profile.")
+            return
+        self.set_profile_controls_enabled(False)
+        self.import_profile_progress_bar = progress_bar
+        progress_bar.setValue(0)
+        progress_bar.setVisible(True)
+        self.import_profile_target = python_exec
+        self.import_profiler_thread = ImportProfilerThread(python_exec, modules)
+        self.import_profiler_thread.progress_signal.connect(self.update_import_profile_progress)
+        self.import_profiler_thread.report_ready_signal.connect(self.show_import_profile_window)
+        self.import_profiler_thread.start()
+
+    def update_import_profile_progress(self, percent):
+        self.import_profile_progress_bar.setValue(percent)
+
+    def show_import_profile_window(self, report):
+        self.set_profile_controls_enabled(True)
+        self.import_profile_progress_bar.setVisible(False)
+
+        window = QWidget()
+        window.setWindowTitle(f"Import Time - {self.describe_target(self.import_profile_target)}")
+        layout = QVBoxLayout()
+
+        table = QTableWidget()
+        table.setColumnCount(5)
+        table.setHorizontalHeaderLabels(
+            ["Module", "Cumulative (ms)", "Self (ms)", "Modules Imported", "Heaviest Imports / Error"]
+        )
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setRowCount(len(report))
+        for row, entry in enumerate(report):
+            table.setItem(row, 0, QTableWidgetItem(entry["module"]))
+            if "error" in entry:
+                for column in (1, 2, 3):
+                    table.setItem(row, column, NumericTableWidgetItem("-", -1))
+                table.setItem(row, 4, QTableWidgetItem(entry["error"]))
+                continue
+            table.setItem(row, 1, NumericTableWidgetItem(f"{entry['cumulative_us'] / 1000:.1f}", entry["cumulative_us"]))
+            table.setItem(row, 2, NumericTableWidgetItem(f"{entry['self_us'] / 1000:.1f}", entry["self_us"]))
+            table.setItem(row, 3, NumericTableWidgetItem(str(entry["modules_imported"]), entry["modules_imported"]))
+            table.setItem(row, 4, QTableWidgetItem(
+                ", ".join(f"{module} ({self_us / 1000:.1f} ms)" for module, self_us in entry["heaviest"])
+            ))
+        table.setSortingEnabled(True)
+        table.sortItems(1, Qt.DescendingOrder)
+        table.resizeColumnsToContents()
+        layout.addWidget(table)
+
+        total_us = sum(entry.get("cumulative_us", 0) for entry in report)
+        layout.addWidget(QLabel(
+            f"Sum of cumulative import times: {total_us / 1000:.1f} ms "
+            "(shared dependencies are counted once per module)."
+        ))
+
+        window.setLayout(layout)
+        window.resize(800, 450)
+        window.show()
+        self.import_profile_window = window  # Keep a reference
+
+    # === Linked Environment Methods ===
+    def create_environment(self):
+        linked = set(linked_environments().values())
+        interpreters = {
+            label: exec_path for label, exec_path in getattr(self, "python_versions", {}).items()
+            if exec_path not in linked
+        }
+        if not interpreters:
+            QMessageBox.warning(self, "Error", "No Python installations found.")
+            return
+        labels = [f"{version} - {exec_path}" for version, exec_path in interpreters.items()]
+        label, ok = QInputDialog.getItem(self, "Create Linked Environment", "Base interpreter:", labels, 0, False)
+        if not ok:
+            return
+        python_exec = list(interpreters.values())[labels.index(label)]
+        parent_dir = QFileDialog.getExistingDirectory(self, "Select Parent Directory", "")
+        if not parent_dir:
+            return
+        name, ok = QInputDialog.getText(self, "Create Linked Environment", "Environment name:", text="venv")
+        if not ok or not name.strip():
+            return
+        env_dir = os.path.join(parent_dir, name.strip())
+        if os.path.exists(env_dir):
+            QMessageBox.warning(self, "Error", f"'{env_dir}' already exists.")
+            return
+        requirements_text, ok = QInputDialog.getText(
+            self, "Create Linked Environment", "Requirements (space separated):",
+            text=" ".join(self.selected_libraries())
+        )
+        if not ok:
+            return
+        if self.install_running():
+            QMessageBox.warning(self, "Busy", "An installation is still running. Please wait for it to finish.")
+            return
+
+        self.set_install_controls_enabled(False)
+        self.env_progress_bar.setValue(0)
+        self.env_progress_bar.setFormat("%p%")
+        self.env_progress_bar.setVisible(True)
+        self.environment_builder_thread = EnvironmentBuilderThread(python_exec, env_dir, requirements_text.split())
+        self.environment_builder_thread.progress_signal.connect(self.update_environment_progress)
+        self.environment_builder_thread.finished_signal.connect(self.handle_environment_created)
+        self.environment_builder_thread.start()
+
+    def update_environment_progress(self, percent, stage):
+        self.env_progress_bar.setValue(percent)
+        self.env_progress_bar.setFormat(f"{stage}... %p%")
+
+    def handle_environment_created(self, stats, error):
+        self.set_install_controls_enabled(True)
+        self.env_progress_bar.setVisible(False)
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to create the environment: {error}")
+            return
+        files = ", ".join(f"{count} {method}" for method, count in sorted(stats["files"].items())) or "no files"
+        QMessageBox.information(
+            self, "Environment Created",
+            f"Created {stats['python']} in {stats['seconds']:.1f} s.\n\n"
+            f"{stats['packages']} packages: {stats['reused_from_store']} reused from the store, "
+            f"{stats['added_to_store']} newly added.\nFiles: {files}."
+        )
+        self.check_python_installations()
+
+    def clean_package_store(self):
+        reply = QMessageBox.question(
+            self, "Clean Package Store",
+            "Delete stored packages that no linked environment uses any more?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        self.set_install_controls_enabled(False)
+        self.env_progress_bar.setMaximum(0)  # Busy indicator
+        self.env_progress_bar.setFormat("Cleaning...")
+        self.env_progress_bar.setVisible(True)
+        self.store_gc_thread = StoreGarbageCollectorThread()
+        self.store_gc_thread.finished_signal.connect(self.handle_store_cleaned)
+        self.store_gc_thread.start()
+
+    def handle_store_cleaned(self, stats, error):
+        self.set_install_controls_enabled(True)
+        self.env_progress_bar.setMaximum(100)
+        self.env_progress_bar.setVisible(False)
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to clean the package store: {error}")
+            return
+        QMessageBox.information(
+            self, "Package Store",
+            f"Removed {stats['removed']} unreferenced package(s), freeing {format_size(stats['freed'])}."
+        )
+
+    # === Environment Matrix Methods ===
+    def compare_environments(self):
+        targets = list(getattr(self, "python_versions", {}).values())
+        if len(targets) < 2:
+            QMessageBox.warning(self, "Error", "At least two Python installations are needed to compare.")
+            return
+        self.compare_envs_button.setEnabled(False)
+        self.environment_matrix_thread = EnvironmentMatrixThread(targets)
+        self.environment_matrix_thread.matrix_ready_signal.connect(self.show_environment_matrix_window)
+        self.environment_matrix_thread.start()
+
+    def show_environment_matrix_window(self, matrix, errors):
+        self.compare_envs_button.setEnabled(True)
+        if errors:
+            QMessageBox.warning(
+                self, "Scan Errors",
+                "\n".join(f"{self.describe_target(target)}: {error}" for target, error in errors.items())
+            )
+        targets = [target for target in self.python_versions.values() if target in matrix]
+        if not targets:
+            return
+        self.environment_matrix = matrix
+
+        window = QWidget()
+        window.setWindowTitle("Environment Matrix")
+        layout = QVBoxLayout()
+
+        self.differences_only_checkbox = QCheckBox("Show differences only")
+        self.differences_only_checkbox.toggled.connect(lambda: self.populate_environment_matrix(targets))
+        layout.addWidget(self.differences_only_checkbox)
+
+        self.matrix_table = QTableWidget()
+        self.matrix_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.matrix_table.setSelectionBehavior(QTableWidget.SelectRows)
+        layout.addWidget(self.matrix_table)
+        self.populate_environment_matrix(targets)
+
+        sync_layout = QHBoxLayout()
+        sync_layout.addWidget(QLabel("Reference:"))
+        self.sync_reference_dropdown = QComboBox()
+        for target in targets:
+            self.sync_reference_dropdown.addItem(self.describe_target(target), target)
+        sync_layout.addWidget(self.sync_reference_dropdown)
+        self.sync_remove_extras_checkbox = QCheckBox("Remove packages not in reference")
+        sync_layout.addWidget(self.sync_remove_extras_checkbox)
+        layout.addLayout(sync_layout)
+
+        layout.addWidget(QLabel("Targets to sync (selected rows only, or everything if none are selected):"))
+        self.sync_targets_list = QListWidget()
+        for target in targets:
+            item = QListWidgetItem(self.describe_target(target))
+            item.setData(Qt.UserRole, target)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Unchecked)
+            self.sync_targets_list.addItem(item)
+        self.sync_targets_list.setMaximumHeight(120)
+        layout.addWidget(self.sync_targets_list)
+
+        self.sync_button = QPushButton("Sync Selected Targets")
+        self.sync_button.setEnabled(not self.install_running())
+        self.sync_button.clicked.connect(self.sync_environments)
+        layout.addWidget(self.sync_button)
+
+        window.setLayout(layout)
+        window.resize(900, 600)
+        window.show()
+        self.environment_matrix_window = window  # Keep a reference
+
+    def populate_environment_matrix(self, targets):
+        matrix = self.environment_matrix
+        names = {}
+        for target in targets:
+            for key, dist in matrix[target].items():
+                names.setdefault(key, dist["name"])
+        differences_only = self.differences_only_checkbox.isChecked()
+        self.matrix_table.setRowCount(0)
+        self.matrix_table.setColumnCount(len(targets) + 1)
+        self.matrix_table.setHorizontalHeaderLabels(
+            ["Distribution"] + [self.describe_target(target).split(" - ")[0] for target in targets]
+        )
+        for key in sorted(names):
+            versions = [matrix[target].get(key, {}).get("version", "") for target in targets]
+            differs = len(set(versions)) > 1
+            if differences_only and not differs:
+                continue
+            row_position = self.matrix_table.rowCount()
+            self.matrix_table.insertRow(row_position)
+            name_item = QTableWidgetItem(names[key])
+            name_item.setData(Qt.UserRole, key)
+            self.matrix_table.setItem(row_position, 0, name_item)
+            for column, version in enumerate(versions, start=1):
+                item = QTableWidgetItem(version or "-")
+                if differs:
+                    item.setBackground(QColor(255, 235, 200))
+                self.matrix_table.setItem(row_position, column, item)
+        self.matrix_table.resizeColumnsToContents()
+
+    def sync_environments(self):
+        reference_target = self.sync_reference_dropdown.currentData()
+        selected_targets = [
+            self.sync_targets_list.item(i).data(Qt.UserRole)
+            for i in range(self.sync_targets_list.count())
+            if self.sync_targets_list.item(i).checkState() == Qt.Checked
+        ]
+        selected_targets = [target for target in selected_targets if target != reference_target]
+        if not selected_targets:
+            QMessageBox.warning(self, "Error", "Please check at least one target other than the reference.")
+            return
+        rows = {index.row() for index in self.matrix_table.selectedIndexes()}
+        names = {self.matrix_table.item(row, 0).data(Qt.UserRole) for row in rows} or None
+
+        reference = self.environment_matrix[reference_target]
+        remove_extras = self.sync_remove_extras_checkbox.isChecked()
+        jobs = []
+        summary = []
+        for target in selected_targets:
+            installed = self.environment_matrix[target]
+            install_args = sync_install_args(reference, installed, names)
+            uninstall_names = sync_uninstall_names(reference, installed, names) if remove_extras else []
+            if install_args:
+                jobs.append((target, build_pip_install_command(target, install_args)))
+            if uninstall_names:
+                jobs.append((target, [target, "-m", "pip", "uninstall", "-y", *uninstall_names]))
+            summary.append(
+                f"{self.describe_target(target)}: {len(install_args)} to install, {len(uninstall_names)} to remove"
+            )
+        if not jobs:
+            QMessageBox.information(self, "Sync", "Selected targets already match the reference.")
+            return
+        reply = QMessageBox.question(
+            self, "Confirm Sync",
+            "\n".join(summary) + "\n\nProceed?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        self.environment_matrix_window.close()
+        self.run_install_jobs(jobs, "Selected environments are now in sync with the reference.")
 
     def open_module_page(self, package_name):
         url = f"https://pypi.org/project/{package_name}/"
@@ -768,6 +3139,7 @@ class LibraryDownloader(QMainWindow):
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No
         )
         if reply == QMessageBox.Yes:
+            self.metadata_fetcher.stop()
             event.accept()
         else:
             event.ignore()